@@ -4,9 +4,14 @@ __version__ = "0.1.0"
 
 from .provider import SandboxProvider, register_provider, get_provider
 from .benchmark import run_benchmark, BenchmarkResult, BenchmarkConfig
-from .scoring import calculate_score, calculate_grade
+from .scoring import (
+    calculate_score,
+    calculate_scores,
+    calculate_grade,
+    calculate_grades,
+)
 from .pricing import estimate_sandbox_cost
-from .capabilities import aggregate_capabilities, capability_score
+from .capabilities import aggregate_capabilities, capability_score, summarize_capabilities
 
 __all__ = [
     "SandboxProvider",
@@ -16,8 +21,11 @@ __all__ = [
     "BenchmarkResult",
     "BenchmarkConfig",
     "calculate_score",
+    "calculate_scores",
     "calculate_grade",
+    "calculate_grades",
     "estimate_sandbox_cost",
     "aggregate_capabilities",
     "capability_score",
+    "summarize_capabilities",
 ]
@@ -1,29 +1,42 @@
 """Core benchmark runner."""
 
+import asyncio
+import json
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from operator import attrgetter
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple, Type, Union
 
-from .provider import SandboxProvider, get_provider
+from .provider import SandboxProvider, aclose_http_client, get_provider
 from .scoring import calculate_score, calculate_grade
 from .pricing import estimate_sandbox_cost
-from .capabilities import aggregate_capabilities, capability_score
-from .suites import PhaseResult, get_suite, list_suites
-
-# Import suites so they register themselves
-from .suites import basic as _basic  # noqa: F401
-from .suites import competitive as _competitive  # noqa: F401
-from .suites import swe as _swe  # noqa: F401
-from .suites import environment as _environment  # noqa: F401
-from .suites import performance as _performance  # noqa: F401
-from .suites import mcp as _mcp  # noqa: F401
-from .suites import networking as _networking  # noqa: F401
-from .suites import training_batch as _training_batch  # noqa: F401
-from .suites import agentic_session as _agentic_session  # noqa: F401
+from .capabilities import summarize_capabilities
+from .suites import PhaseResult, TestSuite, get_suite, list_suites
+
+
+# Trace timestamps are wall-clock, but derived from perf_counter so they
+# stay monotonic and consistent with the measured durations
+_WALL_BASE = time.time()
+_PERF_BASE = time.perf_counter()
+
+
+def _wall_clock() -> float:
+    """Current wall-clock time, anchored at import and advanced monotonically."""
+    return _WALL_BASE + (time.perf_counter() - _PERF_BASE)
+
+
+# Backward-compat per-tool-call token estimates (not used for cost anymore)
+INPUT_TOKENS_PER_CALL = 500
+OUTPUT_TOKENS_PER_CALL = 200
+
+# Seconds to allow a background safety-cleanup destroy
+CLEANUP_TIMEOUT = 30
 
 # The "full" alias expands to all available suites
 SUITE_ALIASES = {
-    "full": ["basic", "competitive", "swe", "environment", "performance", "mcp", "networking", "training_batch", "agentic_session"],
+    "full": ["basic", "competitive", "swe", "environment", "performance", "mcp", "networking", "training_batch", "agentic_session", "throughput"],
 }
 
 
@@ -46,6 +59,27 @@ class BenchmarkConfig:
     benchmark_runs: int = 3
     timeout_seconds: int = 300
 
+    # Max providers benchmarked concurrently (each against its own API).
+    # Some provider SDKs block the event loop (e2b's sync client, vmvm's
+    # vacli calls, blaxel's auth), which would stall every other provider's
+    # timers, so keep at 1 for uncontended timings.
+    max_parallel_providers: int = 1
+
+    # Max warmup/benchmark runs in flight per provider. Each concurrent run
+    # gets its own provider instance; keep at 1 for uncontended timings.
+    max_parallel_runs: int = 1
+
+    # Run each suite on its own sandbox concurrently. Only for providers
+    # that can host several sandboxes per instance (e2b, modal, fly,
+    # blaxel, vmvm); single-sandbox providers must keep this off.
+    parallel_suites: bool = False
+
+    # Trace retention: keep at most this many entries per run in memory
+    # (oldest dropped first; 0 = unbounded), or stream every entry as a
+    # JSON line to trace_stream_path and keep none in memory
+    max_trace_entries: int = 10_000
+    trace_stream_path: Optional[str] = None
+
     # Cost tracking (kept for backward compat but no longer drives cost)
     track_costs: bool = True
     cost_per_1k_input_tokens: float = 0.015
@@ -59,7 +93,7 @@ class BenchmarkResult:
     provider: str
     success: bool
 
-    # Timing
+    # Timing (total excludes authentication, see auth_time_seconds)
     total_time_seconds: float
     auth_time_seconds: float
     create_time_seconds: float
@@ -81,12 +115,8 @@ class BenchmarkResult:
     # Discoverability
     discoverability_score: float
 
-    # Computed
-    score: float = 0.0
-    grade: str = "F"
-
-    # Raw data
-    trace: List[Dict[str, Any]] = field(default_factory=list)
+    # Raw data (converted to dicts only when serialized, see trace_dicts)
+    trace: List["BenchmarkTrace"] = field(default_factory=list)
 
     # New fields for suite system
     suites_run: List[str] = field(default_factory=list)
@@ -94,19 +124,35 @@ class BenchmarkResult:
     capabilities: Dict[str, bool] = field(default_factory=dict)
     capability_score: float = 0.0
     cold_start_seconds: float = 0.0
+    cold_auth_seconds: Optional[float] = None
     warm_start_seconds: Optional[float] = None
     agent_spawn_seconds: Optional[float] = None
     file_io_throughput_mbps: Optional[float] = None
     sandbox_cost_usd: float = 0.0
 
-    def __post_init__(self):
-        self.score = calculate_score(self)
-        self.grade = calculate_grade(self.score)
+    # Computed lazily so discarded warmup results never get scored
+    @cached_property
+    def score(self) -> float:
+        """Overall 0-100 score (higher is better)."""
+        return calculate_score(self)
 
+    @cached_property
+    def grade(self) -> str:
+        """Letter grade for the score."""
+        return calculate_grade(self.score)
 
-@dataclass
+    def trace_dicts(self) -> List[Dict[str, Any]]:
+        """Trace entries as JSON-serializable dicts."""
+        return [t.to_dict() for t in self.trace]
+
+
+@dataclass(frozen=True, slots=True)
 class BenchmarkTrace:
-    """Trace entry for debugging."""
+    """Trace entry for debugging.
+
+    ``details`` is stored without copying: phase details must not be
+    mutated once they have been traced.
+    """
 
     timestamp: float
     action: str
@@ -114,24 +160,95 @@ class BenchmarkTrace:
     success: bool
     details: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "timestamp": self.timestamp,
+            "action": self.action,
+            "duration_ms": self.duration_ms,
+            "success": self.success,
+            "details": self.details,
+        }
+
+
+class _TraceStream:
+    """Trace sink that writes entries as JSON lines instead of keeping them."""
+
+    def __init__(self, fh: IO[str], provider_name: str):
+        self._fh = fh
+        self._provider_name = provider_name
+
+    def _line(self, entry: BenchmarkTrace) -> str:
+        record = {"provider": self._provider_name, **entry.to_dict()}
+        return json.dumps(record, default=str) + "\n"
+
+    def append(self, entry: BenchmarkTrace) -> None:
+        self._fh.write(self._line(entry))
+        self._fh.flush()
+
+    def extend(self, entries: List[BenchmarkTrace]) -> None:
+        self._fh.writelines(self._line(e) for e in entries)
+        self._fh.flush()
+
 
 class BenchmarkRunner:
     """Runs benchmarks against sandbox providers."""
 
     def __init__(self, config: BenchmarkConfig):
         self.config = config
-        self.traces: List[BenchmarkTrace] = []
+        # Suites are stateless, so resolve and instantiate them once
+        self._suite_names = tuple(self._resolve_suites())
+        self._suites: Dict[str, TestSuite] = {
+            name: get_suite(name)() for name in self._suite_names
+        }
+        self._trace_file: Optional[IO[str]] = None
+        self._cleanup_tasks: Dict[SandboxProvider, List[asyncio.Task]] = {}
+
+    def _new_trace_sink(
+        self,
+        provider: SandboxProvider,
+    ) -> Union[Deque[BenchmarkTrace], _TraceStream]:
+        """Create the trace container for one run."""
+        if self.config.trace_stream_path:
+            if self._trace_file is None:
+                self._trace_file = open(self.config.trace_stream_path, "a")
+            return _TraceStream(self._trace_file, provider.name)
+        return deque(maxlen=self.config.max_trace_entries or None)
+
+    def _schedule_cleanup(self, provider: SandboxProvider, sandbox_id: str) -> None:
+        """Destroy a sandbox in a background task, bounded by a timeout."""
+        task = asyncio.create_task(
+            asyncio.wait_for(provider.destroy(sandbox_id), timeout=CLEANUP_TIMEOUT)
+        )
+        self._cleanup_tasks.setdefault(provider, []).append(task)
+
+    async def drain_cleanup(self, provider: Optional[SandboxProvider] = None) -> None:
+        """Wait for background cleanups (for one provider, or all), ignoring errors."""
+        if provider is None:
+            tasks = [t for ts in self._cleanup_tasks.values() for t in ts]
+            self._cleanup_tasks.clear()
+        else:
+            tasks = self._cleanup_tasks.pop(provider, [])
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self) -> None:
+        """Close the trace stream, if one was opened."""
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
 
     def _trace(
         self,
+        traces: Union[Deque[BenchmarkTrace], _TraceStream],
         action: str,
         duration_ms: float,
         success: bool,
         **details,
     ) -> None:
-        """Add a trace entry."""
-        self.traces.append(BenchmarkTrace(
-            timestamp=time.time(),
+        """Add a trace entry (``details`` is already a fresh kwargs dict)."""
+        traces.append(BenchmarkTrace(
+            timestamp=_wall_clock(),
             action=action,
             duration_ms=duration_ms,
             success=success,
@@ -155,13 +272,76 @@ class BenchmarkRunner:
                 unique.append(s)
         return unique
 
+    async def _run_suite(
+        self,
+        provider: SandboxProvider,
+        suite_name: str,
+        sandbox_id: str,
+    ) -> Tuple[List[PhaseResult], Optional[str]]:
+        """Run one suite against a sandbox.
+
+        Returns:
+            Tuple of (phase_results, crash_error). If the suite crashed
+            entirely, phase_results holds a single failed phase.
+        """
+        suite = self._suites[suite_name]
+
+        t_suite = time.perf_counter()
+        try:
+            return await suite.run(provider, sandbox_id), None
+        except Exception as e:
+            # Suite crashed entirely
+            return [PhaseResult(
+                name=f"{suite_name}_error",
+                success=False,
+                duration_seconds=time.perf_counter() - t_suite,
+                errors=1,
+                error_messages=[str(e)],
+            )], f"Suite {suite_name} failed: {e}"
+
+    async def _run_suite_isolated(
+        self,
+        provider: SandboxProvider,
+        suite_name: str,
+    ) -> Tuple[List[PhaseResult], Optional[str]]:
+        """Run one suite in a sandbox of its own, destroying it afterwards."""
+        t_suite = time.perf_counter()
+        try:
+            async with provider.sandbox(
+                timeout_seconds=self.config.timeout_seconds,
+                destroy_timeout=CLEANUP_TIMEOUT,
+            ) as suite_sandbox_id:
+                return await self._run_suite(provider, suite_name, suite_sandbox_id)
+        except Exception as e:
+            return [PhaseResult(
+                name=f"{suite_name}_error",
+                success=False,
+                duration_seconds=time.perf_counter() - t_suite,
+                errors=1,
+                error_messages=[str(e)],
+            )], f"Suite {suite_name} failed: {e}"
+
     async def run_single(
         self,
         provider: SandboxProvider,
         api_key: str,
     ) -> BenchmarkResult:
-        """Run benchmark against a single provider."""
-        self.traces = []
+        """Run benchmark against a single provider.
+
+        Holds no per-run state on the runner, so several calls may be
+        awaited concurrently (with distinct provider instances).
+        """
+        # Providers may track a single sandbox, so a previous run's
+        # background cleanup must finish before this run creates another
+        await self.drain_cleanup(provider)
+
+        # Bind hot attributes to locals
+        perf = time.perf_counter
+        trace = self._trace
+        provider_name = provider.name
+        timeout_seconds = self.config.timeout_seconds
+
+        traces = self._new_trace_sink(provider)
         errors: List[str] = []
         friction_points = 0
         provider.reset_api_calls()
@@ -175,91 +355,130 @@ class BenchmarkRunner:
             "destroy": 0.0,
         }
 
-        start_time = time.time()
+        start_time = perf()
         sandbox_id = None
         success = True
         destroyed = False
 
         # Suite tracking
-        suite_names = self._resolve_suites()
+        suite_names = list(self._suite_names)
+        scored_names = [n for n in suite_names if self._suites[n].scored]
+        unscored_names = [n for n in suite_names if not self._suites[n].scored]
         all_phase_results: List[PhaseResult] = []
+        scored_phase_results: List[PhaseResult] = []
+        # Time and API calls spent in unscored suites, taken back out of
+        # the totals so they don't move the score
+        unscored_time = 0.0
+        unscored_calls = 0
         suite_results: Dict[str, List[Dict[str, Any]]] = {}
 
         try:
             # Phase 1: Authentication
-            t0 = time.time()
+            t0 = perf()
             try:
-                await provider.authenticate(api_key)
-                times["auth"] = time.time() - t0
-                self._trace("authenticate", times["auth"] * 1000, True)
+                authenticated = await provider.ensure_authenticated(api_key)
+                auth_end = perf()
+                times["auth"] = auth_end - t0
+                # Auth is reported on its own (auth_time_seconds,
+                # cold_auth_seconds) and kept out of the total, so providers
+                # with and without reuse_auth are ranked on the same work
+                start_time = auth_end
+                trace(
+                    traces, "authenticate", times["auth"] * 1000, True,
+                    cached=not authenticated,
+                )
             except Exception as e:
                 errors.append(f"Auth failed: {e}")
                 success = False
-                times["auth"] = time.time() - t0
-                self._trace("authenticate", times["auth"] * 1000, False, error=str(e))
+                times["auth"] = perf() - t0
+                trace(traces, "authenticate", times["auth"] * 1000, False, error=str(e))
                 raise
 
             # Phase 2: Create sandbox (cold start)
-            t0 = time.time()
+            t0 = perf()
             try:
                 sandbox_id = await provider.create_sandbox(
-                    timeout_seconds=self.config.timeout_seconds,
+                    timeout_seconds=timeout_seconds,
                 )
-                times["create"] = time.time() - t0
-                self._trace("create_sandbox", times["create"] * 1000, True, sandbox_id=sandbox_id)
+                times["create"] = perf() - t0
+                trace(traces, "create_sandbox", times["create"] * 1000, True, sandbox_id=sandbox_id)
             except Exception as e:
                 errors.append(f"Create failed: {e}")
                 success = False
-                times["create"] = time.time() - t0
-                self._trace("create_sandbox", times["create"] * 1000, False, error=str(e))
+                times["create"] = perf() - t0
+                trace(traces, "create_sandbox", times["create"] * 1000, False, error=str(e))
                 raise
 
             # Run test suites
-            for suite_name in suite_names:
-                suite_class = get_suite(suite_name)
-                suite = suite_class()
-
-                t_suite = time.time()
-                try:
-                    phase_results = await suite.run(provider, sandbox_id)
-                except Exception as e:
-                    # Suite crashed entirely
-                    errors.append(f"Suite {suite_name} failed: {e}")
-                    phase_results = [PhaseResult(
-                        name=f"{suite_name}_error",
-                        success=False,
-                        duration_seconds=time.time() - t_suite,
-                        errors=1,
-                        error_messages=[str(e)],
-                    )]
-
-                suite_duration = time.time() - t_suite
-
-                # Accumulate metrics from phase results
-                suite_phase_dicts = []
-                for pr in phase_results:
-                    friction_points += pr.friction_points
-                    errors.extend(pr.error_messages)
-                    all_phase_results.append(pr)
-
-                    # Add trace entry for each phase
-                    self._trace(
-                        f"{suite_name}/{pr.name}",
-                        pr.duration_seconds * 1000,
-                        pr.success,
-                        **pr.details,
+            if self.config.parallel_suites and len(scored_names) > 1:
+                # First suite reuses the cold-start sandbox; the rest each
+                # get a sandbox of their own and run concurrently
+                suite_outputs = await asyncio.gather(
+                    self._run_suite(provider, scored_names[0], sandbox_id),
+                    *[
+                        self._run_suite_isolated(provider, name)
+                        for name in scored_names[1:]
+                    ],
+                )
+            else:
+                suite_outputs = [
+                    await self._run_suite(provider, name, sandbox_id)
+                    for name in scored_names
+                ]
+
+            # Unscored suites run afterwards, one at a time, so their cost
+            # can be measured and subtracted
+            if unscored_names:
+                t_unscored = perf()
+                calls_before = provider.api_calls
+                for name in unscored_names:
+                    suite_outputs.append(
+                        await self._run_suite(provider, name, sandbox_id)
                     )
+                unscored_time = perf() - t_unscored
+                unscored_calls = provider.api_calls - calls_before
+
+            for suite_name, (phase_results, crash_error) in zip(
+                scored_names + unscored_names, suite_outputs
+            ):
+                all_phase_results.extend(phase_results)
+                if self._suites[suite_name].scored:
+                    if crash_error:
+                        errors.append(crash_error)
+
+                    # Accumulate metrics from phase results
+                    for pr in phase_results:
+                        friction_points += pr.friction_points
+                        errors.extend(pr.error_messages)
+                    scored_phase_results.extend(phase_results)
+
+                # Add trace entries for the suite's phases in one batch
+                now = _wall_clock()
+                traces.extend([
+                    BenchmarkTrace(
+                        timestamp=now,
+                        action=f"{suite_name}/{pr.name}",
+                        duration_ms=pr.duration_seconds * 1000,
+                        success=pr.success,
+                        details=pr.details,
+                    )
+                    for pr in phase_results
+                ])
 
-                    suite_phase_dicts.append({
+                suite_phase_dicts = [
+                    {
                         "name": pr.name,
                         "success": pr.success,
                         "duration_seconds": pr.duration_seconds,
                         "tool_calls": pr.tool_calls,
                         "friction_points": pr.friction_points,
                         "errors": pr.errors,
+                        "error_messages": pr.error_messages,
                         "capability_tested": pr.capability_tested,
                         "capability_supported": pr.capability_supported,
-                    })
+                    }
+                    for pr in phase_results
+                ]
 
                 suite_results[suite_name] = suite_phase_dicts
 
@@ -272,56 +491,49 @@ class BenchmarkRunner:
                             times["file_io"] = pr.duration_seconds
 
             # Phase: Cleanup
-            t0 = time.time()
+            t0 = perf()
             try:
                 await provider.destroy(sandbox_id)
                 destroyed = True
-                times["destroy"] = time.time() - t0
-                self._trace("destroy", times["destroy"] * 1000, True)
+                times["destroy"] = perf() - t0
+                trace(traces, "destroy", times["destroy"] * 1000, True)
             except Exception as e:
                 errors.append(f"Destroy failed: {e}")
-                times["destroy"] = time.time() - t0
-                self._trace("destroy", times["destroy"] * 1000, False, error=str(e))
+                times["destroy"] = perf() - t0
+                trace(traces, "destroy", times["destroy"] * 1000, False, error=str(e))
 
         except Exception:
             success = False
 
         finally:
-            # Safety cleanup - only if not already destroyed
+            # Safety cleanup - only if not already destroyed. Runs in the
+            # background so a failed run isn't held up by a slow destroy.
             if sandbox_id and not destroyed:
-                try:
-                    await provider.destroy(sandbox_id)
-                except Exception:
-                    pass
+                self._schedule_cleanup(provider, sandbox_id)
 
-        total_time = time.time() - start_time
-        tool_calls = provider.api_calls
+        total_time = perf() - start_time - unscored_time
+        tool_calls = provider.api_calls - unscored_calls
 
         # Provider-specific cost estimation
-        sandbox_cost = estimate_sandbox_cost(provider.name, total_time)
+        sandbox_cost = estimate_sandbox_cost(provider_name, total_time)
 
         # Aggregate capabilities from suite results
-        capabilities = aggregate_capabilities(all_phase_results)
-        cap_score = capability_score(capabilities)
+        capabilities, cap_score = summarize_capabilities(scored_phase_results)
 
         # Extract performance metrics if available
-        warm_start_seconds = None
-        agent_spawn_seconds = None
-        file_io_throughput = None
-        for pr in all_phase_results:
-            if pr.name == "agent_spawn" and pr.success:
-                agent_spawn_seconds = pr.details.get("agent_spawn_seconds")
-            if pr.name == "warm_start" and pr.success:
-                warm_start_seconds = pr.details.get("warm_start_seconds")
-            if pr.name == "file_io_1mb_write" and pr.success:
-                file_io_throughput = pr.details.get("throughput_mbps")
-
-        # Backward-compat token estimates (not used for cost anymore)
-        input_tokens = tool_calls * 500
-        output_tokens = tool_calls * 200
+        # (last successful phase of each name wins)
+        succeeded = {pr.name: pr for pr in all_phase_results if pr.success}
+
+        def _detail(phase_name: str, key: str) -> Optional[float]:
+            pr = succeeded.get(phase_name)
+            return pr.details.get(key) if pr is not None else None
+
+        agent_spawn_seconds = _detail("agent_spawn", "agent_spawn_seconds")
+        warm_start_seconds = _detail("warm_start", "warm_start_seconds")
+        file_io_throughput = _detail("file_io_1mb_write", "throughput_mbps")
 
         return BenchmarkResult(
-            provider=provider.name,
+            provider=provider_name,
             success=success,
             total_time_seconds=total_time,
             auth_time_seconds=times["auth"],
@@ -334,69 +546,131 @@ class BenchmarkRunner:
             errors=len(errors),
             error_messages=errors,
             estimated_cost_usd=sandbox_cost,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
+            input_tokens=tool_calls * INPUT_TOKENS_PER_CALL,
+            output_tokens=tool_calls * OUTPUT_TOKENS_PER_CALL,
             discoverability_score=provider.get_discoverability_score(),
-            trace=[{
-                "timestamp": t.timestamp,
-                "action": t.action,
-                "duration_ms": t.duration_ms,
-                "success": t.success,
-                "details": t.details,
-            } for t in self.traces],
+            trace=list(traces) if isinstance(traces, deque) else [],
             suites_run=suite_names,
             suite_results=suite_results,
             capabilities=capabilities,
             capability_score=cap_score,
             cold_start_seconds=times["create"],
+            cold_auth_seconds=(
+                provider.cold_auth_seconds if provider.reuse_auth else times["auth"]
+            ),
             warm_start_seconds=warm_start_seconds,
             agent_spawn_seconds=agent_spawn_seconds,
             file_io_throughput_mbps=file_io_throughput,
             sandbox_cost_usd=sandbox_cost,
         )
 
-    async def run_all(
+    async def _run_repetitions(
         self,
-        api_keys: Dict[str, str],
-    ) -> List[BenchmarkResult]:
-        """Run benchmark against all configured providers."""
-        results = []
+        provider_class: Type[SandboxProvider],
+        provider: SandboxProvider,
+        api_key: str,
+        count: int,
+    ) -> List[Any]:
+        """Run ``count`` independent runs, up to max_parallel_runs at a time.
+
+        Returns one entry per run: a BenchmarkResult or the raised exception.
+        """
+        if self.config.max_parallel_runs <= 1:
+            run_single = self.run_single
+            outcomes: List[Any] = []
+            for _ in range(count):
+                try:
+                    outcomes.append(await run_single(provider, api_key))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
 
-        for provider_name in self.config.providers:
-            if provider_name not in api_keys:
-                print(f"Skipping {provider_name}: no API key provided")
-                continue
+        semaphore = asyncio.Semaphore(self.config.max_parallel_runs)
+
+        async def _one() -> BenchmarkResult:
+            async with semaphore:
+                # Providers keep per-sandbox state, so concurrent runs each
+                # need their own instance
+                return await self.run_single(provider_class(), api_key)
 
+        return await asyncio.gather(
+            *[_one() for _ in range(count)],
+            return_exceptions=True,
+        )
+
+    async def _run_provider(
+        self,
+        provider_name: str,
+        api_key: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[BenchmarkResult]:
+        """Run warmup + benchmark runs for one provider, returning the best result."""
+        async with semaphore:
             provider_class = get_provider(provider_name)
             provider = provider_class()
 
             print(f"Benchmarking {provider_name}...")
-            print(f"  Suites: {', '.join(self._resolve_suites())}")
+            print(f"  Suites: {', '.join(self._suite_names)}")
 
-            # Warmup runs
-            for i in range(self.config.warmup_runs):
-                try:
-                    await self.run_single(provider, api_keys[provider_name])
-                except Exception:
-                    pass
+            # Warmup runs (results discarded)
+            await self._run_repetitions(
+                provider_class, provider, api_key, self.config.warmup_runs
+            )
 
             # Benchmark runs
-            run_results = []
-            for i in range(self.config.benchmark_runs):
-                try:
-                    result = await self.run_single(provider, api_keys[provider_name])
-                    run_results.append(result)
-                except Exception as e:
-                    print(f"  Run {i+1} failed: {e}")
+            outcomes = await self._run_repetitions(
+                provider_class, provider, api_key, self.config.benchmark_runs
+            )
+            # Use the best (fastest) result, picked in the same pass
+            best: Optional[BenchmarkResult] = None
+            for i, outcome in enumerate(outcomes):
+                if isinstance(outcome, BaseException):
+                    print(f"  {provider_name} run {i+1} failed: {outcome}")
+                elif best is None or outcome.total_time_seconds < best.total_time_seconds:
+                    best = outcome
+
+            if best is None:
+                return None
+
+            print(f"  {provider_name}: {best.total_time_seconds:.1f}s, grade {best.grade}")
+            return best
+
+    async def run_all(
+        self,
+        api_keys: Dict[str, str],
+    ) -> List[BenchmarkResult]:
+        """Run benchmark against all configured providers, up to
+        max_parallel_providers at a time."""
+        semaphore = asyncio.Semaphore(max(1, self.config.max_parallel_providers))
+        names = []
+        for provider_name in self.config.providers:
+            if provider_name not in api_keys:
+                print(f"Skipping {provider_name}: no API key provided")
+                continue
+            names.append(provider_name)
 
-            if run_results:
-                # Use the best result
-                best = min(run_results, key=lambda r: r.total_time_seconds)
-                results.append(best)
-                print(f"  {provider_name}: {best.total_time_seconds:.1f}s, grade {best.grade}")
+        try:
+            outcomes = await asyncio.gather(
+                *[
+                    self._run_provider(name, api_keys[name], semaphore)
+                    for name in names
+                ],
+                return_exceptions=True,
+            )
+        finally:
+            await self.drain_cleanup()
+            await aclose_http_client()
+            self.close()
+
+        results = []
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                print(f"  {name} failed: {outcome}")
+            elif outcome is not None:
+                results.append(outcome)
 
         # Sort by score
-        results.sort(key=lambda r: r.score, reverse=True)
+        results.sort(key=attrgetter("score"), reverse=True)
 
         return results
 
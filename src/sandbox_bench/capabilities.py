@@ -1,6 +1,6 @@
 """Capability detection and aggregation."""
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .suites import PhaseResult
 
@@ -80,6 +80,34 @@ def aggregate_capabilities(
     return caps
 
 
+def summarize_capabilities(
+    phase_results: List[PhaseResult],
+) -> Tuple[Dict[str, bool], float]:
+    """Aggregate capabilities and score them in a single pass.
+
+    Equivalent to ``aggregate_capabilities`` followed by
+    ``capability_score``, tracking the supported count as entries are
+    added (a later phase testing the same capability overrides an
+    earlier one).
+
+    Returns:
+        Tuple of (capabilities dict, 0-1 capability score).
+    """
+    caps: Dict[str, bool] = {}
+    supported = 0
+    for pr in phase_results:
+        name = pr.capability_tested
+        ok = pr.capability_supported
+        if name is None or ok is None:
+            continue
+        if caps.get(name):
+            supported -= 1
+        if ok:
+            supported += 1
+        caps[name] = ok
+    return caps, (supported / len(caps) if caps else 0.0)
+
+
 def capability_score(capabilities: Dict[str, bool]) -> float:
     """Calculate a 0-1 score from capabilities dict.
 
@@ -89,5 +117,4 @@ def capability_score(capabilities: Dict[str, bool]) -> float:
     """
     if not capabilities:
         return 0.0
-    supported = sum(1 for v in capabilities.values() if v)
-    return supported / len(capabilities)
+    return sum(map(bool, capabilities.values())) / len(capabilities)
@@ -7,6 +7,7 @@ import asyncio
 import json
 import os
 import sys
+from dataclasses import asdict
 from typing import Dict
 
 from .benchmark import BenchmarkConfig, run_benchmark
@@ -15,40 +16,106 @@ from .suites import list_suites
 from .capabilities import CAPABILITY_DESCRIPTIONS
 
 
-SUITE_CHOICES = ["basic", "competitive", "swe", "environment", "performance", "mcp", "networking", "training_batch", "agentic_session", "full"]
+# BenchmarkResult fields left out of --output JSON (internal timing breakdown
+# and the legacy token estimates)
+_RESULT_JSON_EXCLUDE = frozenset({
+    "auth_time_seconds",
+    "create_time_seconds",
+    "execute_time_seconds",
+    "file_io_time_seconds",
+    "destroy_time_seconds",
+    "input_tokens",
+    "output_tokens",
+})
+
+SUITE_CHOICES = ["basic", "competitive", "swe", "environment", "performance", "mcp", "networking", "training_batch", "agentic_session", "throughput", "full"]
+
+
+# Provider name -> environment variables holding its key, first non-empty wins
+_API_KEY_ENV = (
+    ("e2b", ("E2B_API_KEY",)),
+    ("daytona", ("DAYTONA_API_KEY",)),
+    ("modal", ("MODAL_TOKEN_ID",)),  # Modal uses token ID
+    ("codesandbox", ("CODESANDBOX_API_KEY",)),
+    ("fly", ("SPRITE_TOKEN", "FLY_API_TOKEN")),
+    # Generic providers - pass image name or VM command
+    ("docker-image", ("DOCKER_IMAGE",)),
+    ("microvm", ("MICROVM_COMMAND",)),
+    # Meta internal
+    ("vmvm", ("VMVM_TENANT_ID",)),
+    # Blaxel
+    ("blaxel", ("BL_API_KEY",)),
+)
 
 
 def load_api_keys(env_file: str | None = None) -> Dict[str, str]:
     """Load API keys from environment or file."""
+    env_get = os.environ.get
+
+    # Always read the env file: besides provider keys it carries settings
+    # such as MODAL_TOKEN_SECRET and BL_WORKSPACE. Exported variables win.
     if env_file:
         from dotenv import load_dotenv
-        load_dotenv(env_file)
-
-    return {
-        "e2b": os.environ.get("E2B_API_KEY", ""),
-        "daytona": os.environ.get("DAYTONA_API_KEY", ""),
-        "modal": os.environ.get("MODAL_TOKEN_ID", ""),  # Modal uses token ID
-        "codesandbox": os.environ.get("CODESANDBOX_API_KEY", ""),
-        "fly": os.environ.get("SPRITE_TOKEN", "") or os.environ.get("FLY_API_TOKEN", ""),
-        # Generic providers - pass image name or VM command
-        "docker-image": os.environ.get("DOCKER_IMAGE", ""),
-        "microvm": os.environ.get("MICROVM_COMMAND", ""),
-        # Meta internal
-        "vmvm": os.environ.get("VMVM_TENANT_ID", ""),
-        # Blaxel
-        "blaxel": os.environ.get("BL_API_KEY", ""),
-    }
+        load_dotenv(env_file, override=False)
+
+    keys = {}
+    for provider, env_vars in _API_KEY_ENV:
+        value = ""
+        for env_var in env_vars:
+            value = env_get(env_var, "")
+            if value:
+                break
+        keys[provider] = value
+    return keys
+
+
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def _dumps_indented(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+    return orjson.dumps(
+        obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+    )
+
+
+# Results table borders and row template, built once at import
+_COLUMN_WIDTHS = (14, 8, 7, 10, 8, 8, 7, 7)
+_BORDER_TOP = "\u250c" + "\u2500" * 78 + "\u2510"
+_TITLE_ROW = "\u2502" + " sandbox-bench results".center(78) + "\u2502"
+
+
+def _border(left: str, join: str, right: str) -> str:
+    """Horizontal table rule with the given corner/junction characters."""
+    return left + join.join("\u2500" * w for w in _COLUMN_WIDTHS) + right
+
+
+_BORDER_HEAD = _border("\u251c", "\u252c", "\u2524")
+_BORDER_MID = _border("\u251c", "\u253c", "\u2524")
+_BORDER_BOTTOM = _border("\u2514", "\u2534", "\u2518")
+_ROW_FMT = "\u2502" + "\u2502".join(f" %-{w - 1}s" for w in _COLUMN_WIDTHS) + "\u2502"
+_HEADER_ROW = _ROW_FMT % ("Provider", "Time", "Calls", "Friction", "Errors", "Cost", "Score", "Grade")
 
 
 def print_results_table(results):
     """Print results in a nice table."""
     # Header
     print()
-    print("\u250c" + "\u2500" * 78 + "\u2510")
-    print("\u2502" + " sandbox-bench results".center(78) + "\u2502")
-    print("\u251c" + "\u2500" * 14 + "\u252c" + "\u2500" * 8 + "\u252c" + "\u2500" * 7 + "\u252c" + "\u2500" * 10 + "\u252c" + "\u2500" * 8 + "\u252c" + "\u2500" * 8 + "\u252c" + "\u2500" * 7 + "\u252c" + "\u2500" * 7 + "\u2524")
-    print("\u2502" + " Provider".ljust(14) + "\u2502" + " Time".ljust(8) + "\u2502" + " Calls".ljust(7) + "\u2502" + " Friction".ljust(10) + "\u2502" + " Errors".ljust(8) + "\u2502" + " Cost".ljust(8) + "\u2502" + " Score".ljust(7) + "\u2502" + " Grade".ljust(7) + "\u2502")
-    print("\u251c" + "\u2500" * 14 + "\u253c" + "\u2500" * 8 + "\u253c" + "\u2500" * 7 + "\u253c" + "\u2500" * 10 + "\u253c" + "\u2500" * 8 + "\u253c" + "\u2500" * 8 + "\u253c" + "\u2500" * 7 + "\u253c" + "\u2500" * 7 + "\u2524")
+    print(_BORDER_TOP)
+    print(_TITLE_ROW)
+    print(_BORDER_HEAD)
+    print(_HEADER_ROW)
+    print(_BORDER_MID)
 
     for r in results:
         # Format time
@@ -57,19 +124,18 @@ def print_results_table(results):
         else:
             time_str = f"{r.total_time_seconds:.0f}s"
 
-        print(
-            "\u2502" +
-            f" {r.provider}".ljust(14) + "\u2502" +
-            f" {time_str}".ljust(8) + "\u2502" +
-            f" {r.tool_calls}".ljust(7) + "\u2502" +
-            f" {r.friction_points}".ljust(10) + "\u2502" +
-            f" {r.errors}".ljust(8) + "\u2502" +
-            f" ${r.estimated_cost_usd:.4f}".ljust(8) + "\u2502" +
-            f" {r.score:.0f}".ljust(7) + "\u2502" +
-            f" {r.grade}".ljust(7) + "\u2502"
-        )
-
-    print("\u2514" + "\u2500" * 14 + "\u2534" + "\u2500" * 8 + "\u2534" + "\u2500" * 7 + "\u2534" + "\u2500" * 10 + "\u2534" + "\u2500" * 8 + "\u2534" + "\u2500" * 8 + "\u2534" + "\u2500" * 7 + "\u2534" + "\u2500" * 7 + "\u2518")
+        print(_ROW_FMT % (
+            r.provider,
+            time_str,
+            r.tool_calls,
+            r.friction_points,
+            r.errors,
+            f"${r.estimated_cost_usd:.4f}",
+            f"{r.score:.0f}",
+            r.grade,
+        ))
+
+    print(_BORDER_BOTTOM)
     print()
 
 
@@ -94,21 +160,15 @@ def print_capabilities_matrix(results):
 
     # Header
     cap_width = max(len(c) for c in all_caps) + 2
-    header = "  " + "Provider".ljust(14)
-    for cap in all_caps:
-        header += cap.ljust(cap_width)
-    print(header)
+    print("  " + "Provider".ljust(14) + "".join(cap.ljust(cap_width) for cap in all_caps))
     print("  " + "-" * (14 + cap_width * len(all_caps)))
 
     for r in results:
-        row = "  " + r.provider.ljust(14)
-        for cap in all_caps:
-            if cap in r.capabilities:
-                sym = "Y" if r.capabilities[cap] else "N"
-            else:
-                sym = "-"
-            row += sym.ljust(cap_width)
-        print(row)
+        caps = r.capabilities
+        print("  " + r.provider.ljust(14) + "".join(
+            ("-" if cap not in caps else "Y" if caps[cap] else "N").ljust(cap_width)
+            for cap in all_caps
+        ))
 
     print()
 
@@ -167,6 +227,33 @@ def main():
         default=3,
         help="Number of benchmark runs (default: 3)",
     )
+    run_parser.add_argument(
+        "--parallel-providers",
+        type=int,
+        default=1,
+        help="Providers benchmarked at once (default: 1, for uncontended timings)",
+    )
+    run_parser.add_argument(
+        "--parallel-runs",
+        type=int,
+        default=1,
+        help="Runs in flight per provider (default: 1, for uncontended timings)",
+    )
+    run_parser.add_argument(
+        "--parallel-suites",
+        action="store_true",
+        help="Run each suite on its own sandbox concurrently (multi-sandbox providers only)",
+    )
+    run_parser.add_argument(
+        "--max-trace-entries",
+        type=int,
+        default=10_000,
+        help="Trace entries kept per run, oldest dropped first; 0 = unbounded (default: 10000)",
+    )
+    run_parser.add_argument(
+        "--trace-stream",
+        help="Stream trace entries as JSON lines to this file instead of keeping them",
+    )
 
     # List command
     subparsers.add_parser("list", help="List available providers")
@@ -195,7 +282,7 @@ def main():
 
         # Determine providers to test
         if args.all:
-            providers = [p for p in list_providers() if api_keys.get(p)]
+            providers = list(filter(api_keys.get, list_providers()))
         elif args.provider:
             providers = args.provider
         else:
@@ -216,6 +303,11 @@ def main():
             agent_mode=args.agent_mode,
             model=args.model,
             benchmark_runs=args.runs,
+            max_parallel_providers=args.parallel_providers,
+            max_parallel_runs=args.parallel_runs,
+            parallel_suites=args.parallel_suites,
+            max_trace_entries=args.max_trace_entries,
+            trace_stream_path=args.trace_stream,
         )
 
         print(f"Benchmarking: {', '.join(providers)}")
@@ -224,7 +316,7 @@ def main():
         print()
 
         # Run benchmarks
-        results = asyncio.run(run_benchmark(config, api_keys))
+        results = _run_async(run_benchmark(config, api_keys))
 
         # Print results
         print_results_table(results)
@@ -242,34 +334,16 @@ def main():
                 },
                 "results": [
                     {
-                        "provider": r.provider,
-                        "success": r.success,
-                        "total_time_seconds": r.total_time_seconds,
-                        "tool_calls": r.tool_calls,
-                        "friction_points": r.friction_points,
-                        "errors": r.errors,
-                        "error_messages": r.error_messages,
-                        "estimated_cost_usd": r.estimated_cost_usd,
-                        "sandbox_cost_usd": r.sandbox_cost_usd,
-                        "discoverability_score": r.discoverability_score,
+                        **{k: v for k, v in asdict(r).items() if k not in _RESULT_JSON_EXCLUDE},
                         "score": r.score,
                         "grade": r.grade,
-                        "trace": r.trace,
-                        "suites_run": r.suites_run,
-                        "suite_results": r.suite_results,
-                        "capabilities": r.capabilities,
-                        "capability_score": r.capability_score,
-                        "cold_start_seconds": r.cold_start_seconds,
-                        "warm_start_seconds": r.warm_start_seconds,
-                        "agent_spawn_seconds": r.agent_spawn_seconds,
-                        "file_io_throughput_mbps": r.file_io_throughput_mbps,
                     }
                     for r in results
                 ],
             }
 
-            with open(args.output, "w") as f:
-                json.dump(output, f, indent=2)
+            with open(args.output, "wb") as f:
+                f.write(_dumps_indented(output))
 
             print(f"Results written to {args.output}")
 
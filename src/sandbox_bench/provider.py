@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import subprocess
+import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Dict, Optional, Type
+from typing import Any, AsyncIterator, Dict, Optional, Type
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderInfo:
-    """Metadata about a sandbox provider."""
+    """Metadata about a sandbox provider (immutable, shared per class)."""
     
     name: str
     description: str
@@ -31,6 +36,21 @@ class SandboxProvider(ABC):
     )
     _api_call_count: int = 0
 
+    # Whether authenticate() state survives destroy() and can be reused
+    # across runs with the same key. Leave False for providers that tear
+    # down their clients on destroy.
+    reuse_auth: bool = False
+    _auth_key: Optional[str] = None
+    _auth_lock: Optional[asyncio.Lock] = None
+    cold_auth_seconds: Optional[float] = None
+
+    # Score derived from the class-level ``info``, computed once per class
+    _discoverability: float = 3.0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._discoverability = _discoverability_from_info(cls.info)
+
     @property
     def api_calls(self) -> int:
         """Number of actual API/network calls made by this provider."""
@@ -57,6 +77,35 @@ class SandboxProvider(ABC):
         """
         pass
     
+    async def ensure_authenticated(self, api_key: str) -> bool:
+        """
+        Authenticate, reusing a previous authentication when possible.
+
+        Providers with ``reuse_auth`` set only pay for authenticate() once
+        per key; concurrent callers wait on the first one. The duration of
+        that first call is kept in ``cold_auth_seconds``.
+
+        Args:
+            api_key: The API key or token for authentication
+
+        Returns:
+            True if authenticate() was called, False if it was reused
+        """
+        if not self.reuse_auth:
+            await self.authenticate(api_key)
+            return True
+
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self._auth_key == api_key:
+                return False
+            t0 = time.perf_counter()
+            await self.authenticate(api_key)
+            self.cold_auth_seconds = time.perf_counter() - t0
+            self._auth_key = api_key
+            return True
+
     @abstractmethod
     async def create_sandbox(
         self,
@@ -78,6 +127,31 @@ class SandboxProvider(ABC):
         """
         pass
     
+    @asynccontextmanager
+    async def sandbox(
+        self,
+        image: Optional[str] = None,
+        timeout_seconds: int = 300,
+        destroy_timeout: float = 30.0,
+    ) -> AsyncIterator[str]:
+        """
+        Create a sandbox for the duration of an ``async with`` block.
+
+        The sandbox is destroyed on exit (bounded by ``destroy_timeout``);
+        destroy errors are swallowed so they never mask the block's own.
+
+        Yields:
+            Sandbox ID
+        """
+        sandbox_id = await self.create_sandbox(image=image, timeout_seconds=timeout_seconds)
+        try:
+            yield sandbox_id
+        finally:
+            try:
+                await asyncio.wait_for(self.destroy(sandbox_id), timeout=destroy_timeout)
+            except Exception:
+                pass
+
     @abstractmethod
     async def execute(
         self,
@@ -143,6 +217,49 @@ class SandboxProvider(ABC):
             FileOperationError: If read fails
         """
         pass
+
+    async def write_files(
+        self,
+        sandbox_id: str,
+        files: list[tuple[str, str | bytes]],
+    ) -> None:
+        """
+        Write several files to the sandbox.
+
+        Default implementation calls write_file() for every file
+        concurrently. Providers may override to push them all in one
+        round trip.
+
+        Args:
+            sandbox_id: The sandbox to write to
+            files: (path, content) pairs
+        """
+        await asyncio.gather(*[
+            self.write_file(sandbox_id, path, content) for path, content in files
+        ])
+
+    async def read_files(
+        self,
+        sandbox_id: str,
+        paths: list[str],
+    ) -> list[str | bytes]:
+        """
+        Read several files from the sandbox.
+
+        Default implementation calls read_file() for every path
+        concurrently. Providers may override to fetch them all in one
+        round trip.
+
+        Args:
+            sandbox_id: The sandbox to read from
+            paths: File paths within the sandbox
+
+        Returns:
+            File contents, in the order of ``paths``
+        """
+        return list(await asyncio.gather(*[
+            self.read_file(sandbox_id, path) for path in paths
+        ]))
     
     @abstractmethod
     async def destroy(self, sandbox_id: str) -> None:
@@ -159,23 +276,30 @@ class SandboxProvider(ABC):
         sandbox_id: str,
         command: str,
         timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
         """
         Execute a shell command in the sandbox.
 
         Default implementation delegates to execute() with language="sh".
-        Providers may override for more efficient shell execution.
+        Providers may override for more efficient shell execution, and
+        should stop reading output at max_output_bytes where they stream it.
 
         Args:
             sandbox_id: The sandbox to execute in
             command: Shell command to run
             timeout_seconds: Execution timeout
+            max_output_bytes: Keep at most this much of stdout and of stderr
+                (None keeps everything)
 
         Returns:
             Tuple of (stdout, stderr, exit_code)
         """
-        return await self.execute(
-            sandbox_id, command, language="sh", timeout_seconds=timeout_seconds
+        return cap_output(
+            await self.execute(
+                sandbox_id, command, language="sh", timeout_seconds=timeout_seconds
+            ),
+            max_output_bytes,
         )
 
     async def snapshot(self, sandbox_id: str) -> str:
@@ -223,34 +347,143 @@ class SandboxProvider(ABC):
         Returns:
             Score from 1.0 to 5.0
         """
-        score = 3.0  # Base score for having docs
-        
-        if self.info.mcp_server:
-            score += 1.0
-        if self.info.openapi_spec:
-            score += 0.5
-        if self.info.llms_txt:
-            score += 0.5
-        
-        return min(5.0, score)
+        return self._discoverability
+
+
+def _discoverability_from_info(info: ProviderInfo) -> float:
+    """Discoverability score (1.0-5.0) derived from provider metadata."""
+    score = 3.0  # Base score for having docs
+    
+    if info.mcp_server:
+        score += 1.0
+    if info.openapi_spec:
+        score += 0.5
+    if info.llms_txt:
+        score += 0.5
+    
+    return min(5.0, score)
+
+
+# Shared pooled HTTP client for providers that talk to a local/remote HTTP
+# API, bound to the event loop it was created on
+_http_client: Any = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> Any:
+    """Return the shared ``httpx.AsyncClient`` for the running event loop.
+
+    Reusing one client keeps connections alive across health polls and
+    execute calls instead of reconnecting every time.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop or _http_client.is_closed:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+            timeout=httpx.Timeout(30.0),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client, if one was created on this loop."""
+    global _http_client, _http_client_loop
+    client, _http_client = _http_client, None
+    loop, _http_client_loop = _http_client_loop, None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+async def run_command(
+    *args: str,
+    timeout: Optional[float] = None,
+    input: Optional[bytes] = None,
+) -> tuple[int, bytes, bytes]:
+    """Run a command without blocking the event loop, optionally feeding stdin.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If ``timeout`` elapses (the process is killed)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(input), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(list(args), timeout)
+    return proc.returncode, stdout, stderr
+
+
+def cap_output(
+    result: tuple[str, str, int], max_output_bytes: Optional[int]
+) -> tuple[str, str, int]:
+    """Truncate the stdout and stderr of an execution result to max_output_bytes."""
+    if max_output_bytes is None:
+        return result
+    stdout, stderr, exit_code = result
+    return stdout[:max_output_bytes], stderr[:max_output_bytes], exit_code
 
 
 # Provider registry
 _providers: Dict[str, Type[SandboxProvider]] = {}
 
+# Providers registered by name only; their module is imported (and
+# registers the class) on first lookup, so unused SDKs are never loaded
+_lazy_providers: Dict[str, str] = {}
+
+# Ordered provider names, rebuilt only when a new name is registered
+_provider_names: Optional[tuple[str, ...]] = None
+
 
 def register_provider(provider_class: Type[SandboxProvider]) -> None:
     """Register a provider class."""
+    global _provider_names
+    if provider_class.name not in _providers and provider_class.name not in _lazy_providers:
+        _provider_names = None
     _providers[provider_class.name] = provider_class
 
 
+def register_lazy_provider(name: str, module: str) -> None:
+    """Register a provider by name, deferring import of its module.
+
+    Args:
+        name: Provider name (the class's ``name`` attribute)
+        module: Absolute module path that calls register_provider() on import
+    """
+    global _provider_names
+    if name not in _lazy_providers:
+        _provider_names = None
+    _lazy_providers[name] = module
+
+
 def get_provider(name: str) -> Type[SandboxProvider]:
     """Get a provider class by name."""
+    if name not in _providers and name in _lazy_providers:
+        importlib.import_module(_lazy_providers[name])
     if name not in _providers:
-        raise ValueError(f"Unknown provider: {name}. Available: {list(_providers.keys())}")
+        raise ValueError(f"Unknown provider: {name}. Available: {list(list_providers())}")
     return _providers[name]
 
 
-def list_providers() -> list[str]:
-    """List all registered provider names."""
-    return list(_providers.keys())
+def list_providers() -> tuple[str, ...]:
+    """List all registered provider names (cached until a new one registers)."""
+    global _provider_names
+    if _provider_names is None:
+        _provider_names = tuple(dict.fromkeys([*_lazy_providers, *_providers]))
+    return _provider_names
@@ -1,23 +1,51 @@
-"""Sandbox provider implementations."""
-
-from .e2b import E2BProvider
-from .daytona import DaytonaProvider
-from .modal import ModalProvider
-from .codesandbox import CodeSandboxProvider
-from .fly import FlyProvider
-from .docker_image import DockerImageProvider
-from .microvm import MicroVMProvider
-from .vmvm import VMVMProvider
-from .blaxel import BlaxelProvider
-
-__all__ = [
-    "E2BProvider",
-    "DaytonaProvider",
-    "ModalProvider",
-    "CodeSandboxProvider",
-    "FlyProvider",
-    "DockerImageProvider",
-    "MicroVMProvider",
-    "VMVMProvider",
-    "BlaxelProvider",
-]
+"""Sandbox provider implementations.
+
+Provider modules are imported lazily: importing this package only
+registers provider names, and each provider's SDK is loaded the first
+time the provider (or its class, e.g. ``providers.E2BProvider``) is used.
+"""
+
+import importlib
+
+from ..provider import register_lazy_provider
+
+# Provider name -> module
+_PROVIDER_MODULES = {
+    "e2b": ".e2b",
+    "daytona": ".daytona",
+    "modal": ".modal",
+    "codesandbox": ".codesandbox",
+    "fly": ".fly",
+    "docker-image": ".docker_image",
+    "microvm": ".microvm",
+    "vmvm": ".vmvm",
+    "blaxel": ".blaxel",
+}
+
+# Class name -> module
+_LAZY = {
+    "E2BProvider": ".e2b",
+    "DaytonaProvider": ".daytona",
+    "ModalProvider": ".modal",
+    "CodeSandboxProvider": ".codesandbox",
+    "FlyProvider": ".fly",
+    "DockerImageProvider": ".docker_image",
+    "MicroVMProvider": ".microvm",
+    "VMVMProvider": ".vmvm",
+    "BlaxelProvider": ".blaxel",
+}
+
+for _name, _module in _PROVIDER_MODULES.items():
+    register_lazy_provider(_name, __name__ + _module)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    cls = getattr(module, name)
+    globals()[name] = cls
+    return cls
+
+
+__all__ = list(_LAZY)
@@ -7,7 +7,7 @@ import shlex
 import uuid
 from typing import Optional
 
-from ..provider import SandboxProvider, ProviderInfo, register_provider
+from ..provider import SandboxProvider, ProviderInfo, cap_output, register_provider
 
 
 class BlaxelProvider(SandboxProvider):
@@ -23,6 +23,7 @@ class BlaxelProvider(SandboxProvider):
         openapi_spec=True,
         llms_txt=True,
     )
+    reuse_auth = True
 
     def __init__(self):
         self._sandboxes: dict[str, object] = {}
@@ -119,6 +120,7 @@ class BlaxelProvider(SandboxProvider):
         sandbox_id: str,
         command: str,
         timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
         """Execute a shell command in Blaxel sandbox."""
         sb = self._get(sandbox_id)
@@ -128,7 +130,10 @@ class BlaxelProvider(SandboxProvider):
             "timeout": timeout_seconds * 1000,
         })
         self._count_api_call()
-        return (result.stdout or "", result.stderr or "", result.exit_code)
+        return cap_output(
+            (result.stdout or "", result.stderr or "", result.exit_code),
+            max_output_bytes,
+        )
 
     async def write_file(
         self,
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import itertools
 import httpx
 import msgpack
 import websockets
@@ -10,6 +12,12 @@ from typing import Optional
 
 from ..provider import SandboxProvider, ProviderInfo, register_provider
 
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+# Python snippets at least this long are written to a file and run from
+# there rather than passed through `python3 -c`
+INLINE_CODE_LIMIT = 4096
+
 # Default template for VM-backed Devbox sandboxes
 DEFAULT_TEMPLATE_ID = "pcz35m"
 
@@ -19,21 +27,38 @@ DEFAULT_SUBSCRIPTIONS = {
     "fs": {"operations": True},
 }
 
+# Shared msgpack encoder/decoder. Packing is synchronous, so one Packer is
+# safe to share between coroutines on the event loop.
+_pack = msgpack.Packer(use_bin_type=True).pack
+_unpack = msgpack.unpackb
+
+# Stand-in for a missing/empty "error" field in a rejected response
+_EMPTY_ERROR: dict = {}
+
 
 class PitcherClient:
     """Minimal pitcher protocol client over WebSocket."""
 
     def __init__(self):
         self._ws = None
-        self._msg_id = 0
+        self._msg_ids = itertools.count(1)
         self._pending = {}  # id -> Future
         self._notifications = {}  # method -> list of callbacks
         self._listener_task = None
+        self._loop = None
+        self._heartbeat_task = None
 
     async def connect(self, url: str, token: str):
         """Connect WebSocket and perform client/join handshake."""
         ws_url = f"{url}/?token={token}"
-        self._ws = await websockets.connect(ws_url, max_size=10 * 1024 * 1024)
+        self._loop = asyncio.get_running_loop()
+        # Protocol-level keepalive uses the library's default ping cadence.
+        # Frames are already-compact msgpack, so skip permessage-deflate.
+        self._ws = await websockets.connect(
+            ws_url,
+            max_size=10 * 1024 * 1024,
+            compression=None,
+        )
         self._listener_task = asyncio.create_task(self._listen())
 
         # Perform client/join handshake
@@ -49,73 +74,97 @@ class PitcherClient:
 
     async def _listen(self):
         """Background listener for WebSocket messages."""
+        ws = self._ws
+        pending = self._pending
+        notifications = self._notifications
         try:
-            async for raw in self._ws:
+            async for raw in ws:
                 if isinstance(raw, str):
-                    # Ping/pong - empty string is heartbeat
+                    # Ping/pong - empty string is the pitcher's app-level
+                    # heartbeat; echo it in the background, don't block here
                     if raw == "":
-                        try:
-                            await self._ws.send("")
-                        except Exception:
-                            pass
+                        self._heartbeat_task = asyncio.create_task(self._echo_heartbeat())
                     continue
 
                 try:
-                    msg = msgpack.unpackb(raw, raw=False)
+                    msg = _unpack(raw, raw=False)
                 except Exception:
                     continue
 
-                if "id" in msg and msg["id"] in self._pending:
+                msg_id = msg.get("id")
+                if msg_id is not None:
                     # Response to a request
-                    fut = self._pending.pop(msg["id"])
+                    fut = pending.pop(msg_id, None)
+                    if fut is None or fut.done():
+                        continue
                     if msg.get("status") == 0:  # RESOLVED
                         fut.set_result(msg.get("result"))
                     else:
-                        error = msg.get("error", {})
+                        error = msg.get("error") or _EMPTY_ERROR
                         fut.set_exception(
                             Exception(error.get("message", "Unknown error"))
                         )
-                elif "method" in msg and "params" in msg and "id" not in msg:
+                else:
                     # Notification
-                    method = msg["method"]
-                    if method in self._notifications:
-                        for cb in self._notifications[method]:
-                            cb(msg["params"])
+                    callbacks = notifications.get(msg.get("method"))
+                    if callbacks and "params" in msg:
+                        params = msg["params"]
+                        # Snapshot: a callback may unsubscribe itself
+                        for cb in tuple(callbacks):
+                            cb(params)
         except websockets.exceptions.ConnectionClosed:
             pass
         except Exception:
             pass
 
     def on_notification(self, method: str, callback):
-        """Register a notification listener."""
+        """Register a notification listener; returns the callback as a token."""
         self._notifications.setdefault(method, []).append(callback)
+        return callback
+
+    def off_notification(self, method: str, callback) -> None:
+        """Remove a listener registered with on_notification()."""
+        callbacks = self._notifications.get(method)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
 
     async def request(self, method: str, params, timeout: float = 30.0):
         """Send a request and wait for the response."""
-        self._msg_id += 1
-        msg_id = self._msg_id
+        msg_id = next(self._msg_ids)
 
-        payload = msgpack.packb({
+        payload = _pack({
             "id": msg_id,
             "method": method,
             "params": params,
         })
 
-        loop = asyncio.get_event_loop()
-        fut = loop.create_future()
+        fut = self._loop.create_future()
         self._pending[msg_id] = fut
 
-        await self._ws.send(payload)
-        return await asyncio.wait_for(fut, timeout=timeout)
+        try:
+            await self._ws.send(payload)
+            return await asyncio.wait_for(fut, timeout=timeout)
+        finally:
+            # Normally popped by the listener; drop it ourselves on a send
+            # failure or timeout
+            self._pending.pop(msg_id, None)
+
+    async def _echo_heartbeat(self):
+        """Answer a pitcher heartbeat; a failed echo is left to the listener."""
+        try:
+            await self._ws.send("")
+        except Exception:
+            pass
 
     async def close(self):
         """Close the WebSocket connection."""
-        if self._listener_task:
-            self._listener_task.cancel()
-            try:
-                await self._listener_task
-            except (asyncio.CancelledError, Exception):
-                pass
+        for task in (self._heartbeat_task, self._listener_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
         if self._ws:
             await self._ws.close()
 
@@ -142,6 +191,7 @@ class CodeSandboxProvider(SandboxProvider):
         self._pitcher = None
         self._sandbox_id = None
         self._workspace_path = "/project/sandbox"
+        self._script_seq = 0
 
     async def authenticate(self, api_key: str) -> None:
         """Authenticate with CodeSandbox using a Bearer API token."""
@@ -152,6 +202,10 @@ class CodeSandboxProvider(SandboxProvider):
                 "Content-Type": "application/json",
             },
             timeout=60.0,
+            # Keep the connection across fork/start/shutdown/delete; HTTP/2
+            # needs the h2 package (codesandbox extra)
+            http2=_HAS_H2,
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
         )
         # Validate the token
         resp = await self._mgmt_client.get(
@@ -209,23 +263,60 @@ class CodeSandboxProvider(SandboxProvider):
         timeout_seconds: int = 30,
     ) -> tuple[str, str, int]:
         """Execute code via pitcher shell/create."""
-        if language == "python":
+        if language == "python" and len(code) >= INLINE_CODE_LIMIT:
+            # Large scripts go through a file instead of a huge quoted argv.
+            # The write is part of this one execute, so it isn't counted as
+            # a call of its own, and the file is removed once it has run
+            self._script_seq += 1
+            script_path = f"/tmp/__bench_{self._script_seq}.py"
+            await self._pitcher.request("fs/writeFile", {
+                "path": script_path,
+                "content": code.encode("utf-8"),
+                "create": True,
+                "overwrite": True,
+            })
+            command = (
+                f"python3 {script_path}; rc=$?; rm -f {script_path}; exit $rc"
+            )
+        elif language == "python":
             command = f"python3 -c {_shell_quote(code)}"
         else:
             command = code
 
-        # Collect output from notifications
+        # Collect output from notifications. Chunks arrive already decoded
+        # (msgpack raw=False), so keep them as str and join once at the end.
         output_parts = []
+        append_output = output_parts.append
         exit_info = {"code": None}
         output_event = asyncio.Event()
 
-        def on_shell_out(params):
-            output_parts.append(params.get("out", ""))
+        # Notifications for every shell on the connection reach these
+        # callbacks; only this command's shell counts. Its id is known once
+        # shell/create returns, so anything earlier is held until then.
+        shell = {"id": None, "known": False}
+        early = []
 
-        def on_shell_exit(params):
+        def handle_out(params):
+            out = params.get("out")
+            if out:
+                append_output(out)
+
+        def handle_exit(params):
             exit_info["code"] = params.get("exitCode", 0)
             output_event.set()
 
+        def on_shell_out(params):
+            if not shell["known"]:
+                early.append((handle_out, params))
+            elif params.get("shellId") == shell["id"]:
+                handle_out(params)
+
+        def on_shell_exit(params):
+            if not shell["known"]:
+                early.append((handle_exit, params))
+            elif params.get("shellId") == shell["id"]:
+                handle_exit(params)
+
         self._pitcher.on_notification("shell/out", on_shell_out)
         self._pitcher.on_notification("shell/exit", on_shell_exit)
 
@@ -244,6 +335,13 @@ class CodeSandboxProvider(SandboxProvider):
             if buffer:
                 output_parts.extend(buffer)
 
+            shell["id"] = result.get("shellId")
+            shell["known"] = True
+            for handle, params in early:
+                if params.get("shellId") == shell["id"]:
+                    handle(params)
+            early.clear()
+
             # If already finished, exit event might already have fired or
             # the status might be in the result
             status = result.get("status", "")
@@ -259,9 +357,10 @@ class CodeSandboxProvider(SandboxProvider):
                 except asyncio.TimeoutError:
                     exit_code = -1
         finally:
-            # Clean up listeners
-            self._pitcher._notifications.get("shell/out", []).clear()
-            self._pitcher._notifications.get("shell/exit", []).clear()
+            # Remove only this command's listeners; concurrent commands keep
+            # theirs, and the shellId check keeps their output apart
+            self._pitcher.off_notification("shell/out", on_shell_out)
+            self._pitcher.off_notification("shell/exit", on_shell_exit)
 
         stdout = "".join(output_parts)
         return (stdout, "", exit_code)
@@ -273,8 +372,12 @@ class CodeSandboxProvider(SandboxProvider):
         content: str | bytes,
     ) -> None:
         """Write file via pitcher fs/writeFile."""
+        # msgpack frames bytes as a raw bin field (no base64); make sure
+        # buffers like bytearray/memoryview reach it as plain bytes
         if isinstance(content, str):
             content = content.encode("utf-8")
+        elif not isinstance(content, bytes):
+            content = bytes(content)
 
         await self._pitcher.request("fs/writeFile", {
             "path": path,
@@ -301,27 +404,30 @@ class CodeSandboxProvider(SandboxProvider):
 
     async def destroy(self, sandbox_id: str) -> None:
         """Shutdown and delete the CodeSandbox sandbox."""
-        try:
+
+        async def close_pitcher():
             if self._pitcher:
                 await self._pitcher.close()
                 self._count_api_call()
-        except Exception:
-            pass
-        try:
+
+        async def shutdown_vm():
             if self._mgmt_client and self._sandbox_id:
-                try:
-                    await self._mgmt_client.post(
-                        f"{self.MANAGEMENT_URL}/vm/{self._sandbox_id}/shutdown",
-                    )
-                    self._count_api_call()
-                except Exception:
-                    pass
-                await self._mgmt_client.delete(
-                    f"{self.MANAGEMENT_URL}/vm/{self._sandbox_id}",
+                await self._mgmt_client.post(
+                    f"{self.MANAGEMENT_URL}/vm/{self._sandbox_id}/shutdown",
                 )
                 self._count_api_call()
-        except Exception:
-            pass
+
+        try:
+            # Closing the socket doesn't depend on the shutdown call
+            await asyncio.gather(close_pitcher(), shutdown_vm(), return_exceptions=True)
+            try:
+                if self._mgmt_client and self._sandbox_id:
+                    await self._mgmt_client.delete(
+                        f"{self.MANAGEMENT_URL}/vm/{self._sandbox_id}",
+                    )
+                    self._count_api_call()
+            except Exception:
+                pass
         finally:
             if self._mgmt_client:
                 await self._mgmt_client.aclose()
@@ -329,6 +435,8 @@ class CodeSandboxProvider(SandboxProvider):
 
 def _shell_quote(s: str) -> str:
     """Quote a string for safe shell usage."""
+    if "'" not in s:
+        return f"'{s}'"
     return "'" + s.replace("'", "'\\''") + "'"
 
 
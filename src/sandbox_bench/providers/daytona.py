@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import shlex
 from typing import Optional
 
 from ..provider import SandboxProvider, ProviderInfo, register_provider
 
 
 class DaytonaProvider(SandboxProvider):
-    """Daytona sandbox provider (Docker-based)."""
+    """Daytona sandbox provider (Docker-based).
+
+    The Daytona SDK is synchronous, so its calls run in a worker thread to
+    keep the event loop free for other providers.
+    """
     
     name = "daytona"
     info = ProviderInfo(
@@ -21,6 +27,7 @@ class DaytonaProvider(SandboxProvider):
         openapi_spec=True,
         llms_txt=False,
     )
+    reuse_auth = True
     
     def __init__(self):
         self._client = None
@@ -45,7 +52,7 @@ class DaytonaProvider(SandboxProvider):
         timeout_seconds: int = 300,
     ) -> str:
         """Create a Daytona sandbox."""
-        self._sandbox = self._client.create()
+        self._sandbox = await asyncio.to_thread(self._client.create)
         self._count_api_call()
         return self._sandbox.id
     
@@ -58,9 +65,11 @@ class DaytonaProvider(SandboxProvider):
     ) -> tuple[str, str, int]:
         """Execute code in Daytona sandbox."""
         if language == "python":
-            response = self._sandbox.process.code_run(code)
+            response = await asyncio.to_thread(self._sandbox.process.code_run, code)
         else:
-            response = self._sandbox.process.exec(f"echo '{code}' | {language}")
+            response = await asyncio.to_thread(
+                self._sandbox.process.exec, f"{language} -c {shlex.quote(code)}"
+            )
         self._count_api_call()
 
         # Handle the response based on available attributes
@@ -79,7 +88,7 @@ class DaytonaProvider(SandboxProvider):
         """Write file to Daytona sandbox."""
         if isinstance(content, str):
             content = content.encode('utf-8')
-        self._sandbox.fs.upload_file(content, path)
+        await asyncio.to_thread(self._sandbox.fs.upload_file, content, path)
         self._count_api_call()
     
     async def read_file(
@@ -88,7 +97,7 @@ class DaytonaProvider(SandboxProvider):
         path: str,
     ) -> str | bytes:
         """Read file from Daytona sandbox."""
-        content = self._sandbox.fs.download_file(path)
+        content = await asyncio.to_thread(self._sandbox.fs.download_file, path)
         self._count_api_call()
         # Return as string for comparison
         if isinstance(content, bytes):
@@ -98,7 +107,7 @@ class DaytonaProvider(SandboxProvider):
     async def destroy(self, sandbox_id: str) -> None:
         """Destroy Daytona sandbox."""
         if self._sandbox:
-            self._client.delete(self._sandbox)
+            await asyncio.to_thread(self._client.delete, self._sandbox)
             self._count_api_call()
 
 
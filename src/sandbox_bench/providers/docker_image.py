@@ -8,15 +8,130 @@ with /health, /execute, /write_file, /read_file endpoints.
 from __future__ import annotations
 
 import asyncio
+import io
 import os
+import posixpath
+import socket
 import subprocess
+import tarfile
 import time
 import uuid
 from typing import Optional
 
 import httpx
 
-from ..provider import SandboxProvider, ProviderInfo, register_provider
+from ..provider import (
+    SandboxProvider,
+    ProviderInfo,
+    cap_output,
+    get_http_client,
+    register_provider,
+    run_command,
+)
+
+# /execute bodies can carry large program output; use orjson when installed
+try:
+    import orjson
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+else:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Docker Engine API socket used for file transfers when DOCKER_HOST is unset
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Docker-side readiness probe; lets create_sandbox wait on the container's
+# health state over the Engine API instead of polling /health from Python.
+# Exits 127 only when the image has neither curl nor wget, so a server that
+# is merely slow to start isn't mistaken for a missing probe
+_HEALTH_ARGS = (
+    "--health-cmd",
+    "if command -v curl >/dev/null; then curl -fsS http://localhost:8000/health; "
+    "elif command -v wget >/dev/null; then wget -qO- http://localhost:8000/health; "
+    "else exit 127; fi",
+    # Probe every 100ms only while starting up; the first success ends the
+    # start period, after which the long interval keeps the probe from
+    # running (and competing with timed phases) for the container's life
+    "--health-start-period", "60s",
+    "--health-start-interval", "100ms",
+    "--health-interval", "24h",
+    "--health-timeout", "1s",
+)
+
+# --health-start-interval needs Engine API 1.44 (Docker 25)
+_HEALTH_MIN_API = (1, 44)
+
+# Probe exit code for "command not found"; Docker records -1 when the probe
+# couldn't be started at all (e.g. no /bin/sh in the image)
+_PROBE_MISSING = (127, -1)
+
+# Label put on every container so the events stream can be filtered to ours
+_CONTAINER_LABEL = "sandbox-bench"
+_EVENTS_FILTER = _dumps({"type": ["container"], "label": [_CONTAINER_LABEL]}).decode()
+
+# Container event action -> `docker inspect` State.Status
+_EVENT_STATUS = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+}
+
+
+def _single_file_tar(name: str, content: bytes) -> bytes:
+    """Build an in-memory tar archive holding one file."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        info = tarfile.TarInfo(name)
+        info.size = len(content)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(content))
+    return buf.getvalue()
+
+
+async def _read_exec_stream(
+    api: httpx.AsyncClient, exec_id: str, limit: Optional[int] = None
+) -> tuple[bytearray, bytearray]:
+    """Start an exec and demultiplex its output into (stdout, stderr).
+
+    Non-TTY output is framed: an 8-byte header (stream type, three zero
+    bytes, big-endian payload size) followed by the payload. With a limit,
+    each stream keeps only its first ``limit`` bytes; the rest is read and
+    dropped so the command still runs to completion.
+
+    The stream has no read timeout, since a command may print nothing for a
+    long time; callers bound the whole exec instead.
+    """
+    out = (bytearray(), bytearray())
+    buf = bytearray()
+    async with api.stream(
+        "POST", f"/exec/{exec_id}/start", json={"Detach": False, "Tty": False},
+        timeout=httpx.Timeout(None),
+    ) as stream:
+        stream.raise_for_status()
+        async for chunk in stream.aiter_bytes():
+            buf += chunk
+            while len(buf) >= 8:
+                size = int.from_bytes(buf[4:8], "big")
+                if len(buf) < 8 + size:
+                    break
+                dest = out[buf[0] == 2]
+                if limit is None:
+                    dest.extend(buf[8:8 + size])
+                elif len(dest) < limit:
+                    dest.extend(buf[8:8 + min(size, limit - len(dest))])
+                del buf[:8 + size]
+    return out
 
 
 class DockerImageProvider(SandboxProvider):
@@ -32,12 +147,30 @@ class DockerImageProvider(SandboxProvider):
         openapi_spec=False,
         llms_txt=False,
     )
+    reuse_auth = True
+
+    # Consecutive refused connections to /execute before falling back to
+    # docker exec for the rest of the container's life
+    HTTP_CONNECT_RETRIES = 3
+
+    # How long a `docker inspect` status result is reused
+    STATUS_TTL = 1.0
 
     def __init__(self):
         self._container_id: Optional[str] = None
         self._image: Optional[str] = None
         self._port: int = 8000
         self._base_url: Optional[str] = None
+        self._execute_url: Optional[str] = None
+        self._status_cache: Optional[tuple[str, float, str]] = None
+        self._container_state: dict[str, str] = {}
+        self._events_task: Optional[asyncio.Task] = None
+        self._container_health: dict[str, str] = {}
+        self._health_changed = asyncio.Event()
+        self._engine_client: Optional[httpx.AsyncClient] = None
+        self._use_http = True
+        self._http_connect_failures = 0
+        self._health_args: dict[str, tuple[str, ...]] = {}
 
     async def authenticate(self, api_key: str) -> None:
         """
@@ -48,12 +181,8 @@ class DockerImageProvider(SandboxProvider):
         """
         # Validate Docker is available
         try:
-            result = subprocess.run(
-                ["docker", "info"],
-                capture_output=True,
-                timeout=10
-            )
-            if result.returncode != 0:
+            returncode, _, _ = await run_command("docker", "info", timeout=10)
+            if returncode != 0:
                 raise RuntimeError("Docker daemon not running")
         except FileNotFoundError:
             raise ImportError("Docker not installed")
@@ -80,45 +209,141 @@ class DockerImageProvider(SandboxProvider):
             "docker", "run", "-d",
             "--name", container_name,
             "-p", f"{self._port}:8000",
+            "--label", _CONTAINER_LABEL,
+            *await self._readiness_health_args(docker_image),
             docker_image
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to start container: {result.stderr}")
+        returncode, stdout, stderr = await run_command(*cmd)
+        if returncode != 0:
+            raise RuntimeError(f"Failed to start container: {stderr.decode()}")
 
-        self._container_id = result.stdout.strip()
+        self._container_id = stdout.strip().decode("ascii")
         self._base_url = f"http://localhost:{self._port}"
+        self._execute_url = f"{self._base_url}/execute"
+        # Events missed before the subscription starts are covered by the
+        # docker inspect fallbacks in get_status / _wait_for_healthy
+        self._watch_events()
 
         # Wait for ready
-        await self._wait_for_ready(timeout_seconds=60)
+        try:
+            await self._wait_for_ready(timeout_seconds=60)
+        except BaseException:
+            await self._stop_events()
+            raise
+        self._use_http = True
+        self._http_connect_failures = 0
         return self._container_id
 
-    def _find_available_port(self, start: int = 8100, end: int = 8200) -> int:
-        """Find an available port."""
-        import socket
-        for port in range(start, end):
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(("localhost", port))
-                    return port
-                except OSError:
-                    continue
-        raise RuntimeError(f"No available ports in range {start}-{end}")
+    def _find_available_port(self) -> int:
+        """Find an available port (the kernel picks a free ephemeral one)."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            return s.getsockname()[1]
+
+    async def _readiness_health_args(self, image: str) -> tuple[str, ...]:
+        """Health-check flags for readiness polling, or none.
+
+        Only added when the Engine API is there to watch the status, the
+        daemon supports a start interval, and the image doesn't define its
+        own HEALTHCHECK (which the flags would replace).
+        """
+        if image in self._health_args:
+            return self._health_args[image]
+        args: tuple[str, ...] = ()
+        api = self._engine_api()
+        if api is not None:
+            try:
+                version = await api.get("/version")
+                api_version = _loads(version.content).get("ApiVersion", "0.0")
+                supported = tuple(map(int, api_version.split(".")[:2])) >= _HEALTH_MIN_API
+                if supported:
+                    resp = await api.get(f"/images/{image}/json")
+                    if resp.status_code == 200:
+                        config = _loads(resp.content).get("Config") or {}
+                        if not config.get("Healthcheck"):
+                            args = _HEALTH_ARGS
+            except (httpx.RequestError, ValueError):
+                pass
+        self._health_args[image] = args
+        return args
 
     async def _wait_for_ready(self, timeout_seconds: int = 60) -> None:
-        """Wait for the container to be ready."""
-        start = time.time()
-        async with httpx.AsyncClient() as client:
-            while time.time() - start < timeout_seconds:
+        """Wait for the container to be ready.
+
+        Watches Docker's health status over the Engine API when possible,
+        falling back to polling /health directly if the probe can't run in
+        the image (no shell, curl or wget) or the API is unavailable.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        if await self._wait_for_healthy(deadline):
+            return
+
+        client = get_http_client()
+        # Poll quickly at first so a fast-starting container is noticed
+        # within tens of ms, backing off to 0.5s
+        delay = 0.025
+        while time.monotonic() < deadline:
+            try:
+                resp = await client.get(f"{self._base_url}/health", timeout=1.0)
+                if resp.status_code == 200:
+                    return
+            except httpx.RequestError:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        raise RuntimeError(f"Container not ready after {timeout_seconds}s")
+
+    async def _wait_for_healthy(self, deadline: float) -> bool:
+        """Wait for the container's health status to report healthy.
+
+        Health transitions are pushed by the events stream when it's running;
+        `docker inspect` is still consulted between them to catch a probe
+        that keeps failing. Returns False if the status can't be used, so
+        the caller falls back to HTTP polling.
+        """
+        api = self._engine_api()
+        if api is None or not self._container_id:
+            return False
+        while time.monotonic() < deadline:
+            watching = self._events_task is not None and not self._events_task.done()
+            if watching:
+                status = self._container_health.get(self._container_id)
+                if status == "healthy":
+                    return True
+                if status == "unhealthy":
+                    return False
+                self._health_changed.clear()
                 try:
-                    resp = await client.get(f"{self._base_url}/health", timeout=2)
-                    if resp.status_code == 200:
-                        return
-                except httpx.RequestError:
+                    await asyncio.wait_for(
+                        self._health_changed.wait(),
+                        timeout=max(min(0.25, deadline - time.monotonic()), 0),
+                    )
+                    continue
+                except asyncio.TimeoutError:
                     pass
-                await asyncio.sleep(0.5)
-        raise RuntimeError(f"Container not ready after {timeout_seconds}s")
+            try:
+                resp = await api.get(f"/containers/{self._container_id}/json")
+            except httpx.RequestError:
+                return False
+            if resp.status_code != 200:
+                return False
+            health = (_loads(resp.content).get("State") or {}).get("Health")
+            if not health:
+                return False
+            status = health.get("Status")
+            if status == "healthy":
+                return True
+            # Fall back to HTTP polling if the probe can't run in this image;
+            # other failures just mean the server isn't up yet
+            log = health.get("Log") or []
+            if status == "unhealthy" or any(
+                entry.get("ExitCode") in _PROBE_MISSING for entry in log
+            ):
+                return False
+            if not watching:
+                await asyncio.sleep(0.05)
+        return False
 
     async def execute(
         self,
@@ -126,38 +351,186 @@ class DockerImageProvider(SandboxProvider):
         code: str,
         language: str = "python",
         timeout_seconds: int = 30,
+        *,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
         """Execute code in the container."""
-        # Try HTTP API first
-        async with httpx.AsyncClient() as client:
+        # Use the HTTP API unless an earlier call showed the container
+        # doesn't serve /execute
+        if self._use_http:
+            client = get_http_client()
             try:
                 resp = await client.post(
-                    f"{self._base_url}/execute",
-                    json={"code": code, "language": language},
+                    self._execute_url,
+                    content=_dumps({"code": code, "language": language}),
+                    headers=_JSON_HEADERS,
                     timeout=timeout_seconds
                 )
+                self._http_connect_failures = 0
                 if resp.status_code == 200:
-                    data = resp.json()
-                    return (
-                        data.get("stdout", ""),
-                        data.get("stderr", ""),
-                        data.get("exit_code", 0)
+                    data = _loads(resp.content)
+                    return cap_output(
+                        (
+                            data.get("stdout", ""),
+                            data.get("stderr", ""),
+                            data.get("exit_code", 0)
+                        ),
+                        max_output_bytes,
                     )
+                if resp.status_code in (404, 405, 501):
+                    self._use_http = False
+            except httpx.ConnectError:
+                # A blip shouldn't cost the rest of the run; only a server
+                # that keeps refusing connections is given up on
+                self._http_connect_failures += 1
+                if self._http_connect_failures >= self.HTTP_CONNECT_RETRIES:
+                    self._use_http = False
             except httpx.RequestError:
                 pass
 
-        # Fall back to docker exec
+        # Fall back to docker exec, through the Engine API when reachable
         if language == "python":
-            cmd = ["docker", "exec", self._container_id, "python3", "-c", code]
+            argv = ["python3", "-c", code]
         else:
-            cmd = ["docker", "exec", self._container_id, "sh", "-c", code]
+            argv = ["sh", "-c", code]
+
+        try:
+            result = await asyncio.wait_for(
+                self._engine_exec(argv, max_output_bytes), timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            return ("", f"Timeout after {timeout_seconds}s", 1)
+        if result is not None:
+            return result
 
+        cmd = ["docker", "exec", self._container_id, *argv]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_seconds)
-            return (result.stdout, result.stderr, result.returncode)
+            returncode, stdout, stderr = await run_command(*cmd, timeout=timeout_seconds)
+            return cap_output(
+                (stdout.decode(), stderr.decode(), returncode), max_output_bytes
+            )
         except subprocess.TimeoutExpired:
             return ("", f"Timeout after {timeout_seconds}s", 1)
 
+    async def execute_command(
+        self,
+        sandbox_id: str,
+        command: str,
+        timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
+    ) -> tuple[str, str, int]:
+        """Execute a shell command, capping output while it is read."""
+        return await self.execute(
+            sandbox_id, command, language="sh", timeout_seconds=timeout_seconds,
+            max_output_bytes=max_output_bytes,
+        )
+
+    async def _engine_exec(
+        self, argv: list[str], max_output_bytes: Optional[int] = None
+    ) -> Optional[tuple[str, str, int]]:
+        """Run ``argv`` in the container via the Engine exec API.
+
+        Returns None if the API is unavailable, so the caller can use the CLI.
+        """
+        api = self._engine_api()
+        if api is None:
+            return None
+        try:
+            resp = await api.post(
+                f"/containers/{self._container_id}/exec",
+                content=_dumps({"Cmd": argv, "AttachStdout": True, "AttachStderr": True}),
+                headers=_JSON_HEADERS,
+            )
+        except httpx.RequestError:
+            return None
+        if resp.status_code != 201:
+            return None
+        exec_id = _loads(resp.content)["Id"]
+
+        # Once started the command may have run, so errors are raised rather
+        # than falling back (which could run it a second time)
+        try:
+            stdout, stderr = await _read_exec_stream(api, exec_id, max_output_bytes)
+            # The exit code can lag the end of the output stream briefly
+            while True:
+                info = _loads((await api.get(f"/exec/{exec_id}/json")).content)
+                exit_code = info.get("ExitCode")
+                if exit_code is not None or not info.get("Running"):
+                    break
+                await asyncio.sleep(0.01)
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"docker exec failed: {e}") from e
+        if exit_code is None:
+            raise RuntimeError(f"docker exec {exec_id} finished without an exit code")
+        return (stdout.decode("utf-8", "replace"), stderr.decode("utf-8", "replace"), exit_code)
+
+    def _engine_api(self) -> Optional[httpx.AsyncClient]:
+        """Client for the Docker Engine API on the local socket, if usable."""
+        if self._engine_client is None:
+            docker_host = os.environ.get("DOCKER_HOST", "")
+            if docker_host.startswith("unix://"):
+                sock = docker_host[len("unix://"):]
+            elif docker_host:
+                return None  # Remote/TCP daemon: stick to the CLI
+            else:
+                sock = DOCKER_SOCKET
+            if not os.path.exists(sock):
+                return None
+            self._engine_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=sock),
+                base_url="http://docker",
+                timeout=60.0,
+            )
+        return self._engine_client
+
+    def _watch_events(self) -> None:
+        """Start following container events, if not already."""
+        if self._events_task is not None and not self._events_task.done():
+            return
+        api = self._engine_api()
+        if api is not None:
+            self._events_task = asyncio.create_task(self._follow_events(api))
+
+    async def _stop_events(self) -> None:
+        """Cancel the events stream task, if running."""
+        if self._events_task is None:
+            return
+        self._events_task.cancel()
+        try:
+            await self._events_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._events_task = None
+
+    async def _follow_events(self, api: httpx.AsyncClient) -> None:
+        """Keep container state and health current from the Engine API events stream."""
+        state = self._container_state
+        health = self._container_health
+        try:
+            async with api.stream(
+                "GET", "/events", params={"filters": _EVENTS_FILTER}, timeout=None
+            ) as stream:
+                async for line in stream.aiter_lines():
+                    if not line:
+                        continue
+                    event = _loads(line)
+                    container_id = event.get("id")
+                    action = event.get("Action") or event.get("status")
+                    if action == "destroy":
+                        state.pop(container_id, None)
+                        health.pop(container_id, None)
+                    elif action in _EVENT_STATUS:
+                        state[container_id] = _EVENT_STATUS[action]
+                    elif action and action.startswith("health_status"):
+                        # e.g. "health_status: healthy"
+                        health[container_id] = action.rpartition(" ")[2]
+                        self._health_changed.set()
+        except httpx.HTTPError:
+            pass  # get_status / _wait_for_healthy fall back to docker inspect
+        finally:
+            state.clear()
+            health.clear()
+
     async def write_file(
         self,
         sandbox_id: str,
@@ -168,44 +541,94 @@ class DockerImageProvider(SandboxProvider):
         if isinstance(content, str):
             content = content.encode('utf-8')
 
-        import tempfile
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(content)
-            temp_path = f.name
+        # Put a one-file tar straight into the container via the Engine API,
+        # or pipe the same archive into `docker cp -`
+        target = posixpath.join("/", path)
+        archive = _single_file_tar(posixpath.basename(target), content)
+        api = self._engine_api()
+        if api is not None:
+            try:
+                resp = await api.put(
+                    f"/containers/{self._container_id}/archive",
+                    params={"path": posixpath.dirname(target)},
+                    content=archive,
+                    headers={"Content-Type": "application/x-tar"},
+                )
+                if resp.status_code == 200:
+                    return
+            except httpx.RequestError:
+                pass
 
-        try:
-            cmd = ["docker", "cp", temp_path, f"{self._container_id}:{path}"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to write file: {result.stderr}")
-        finally:
-            os.remove(temp_path)
+        cmd = ["docker", "cp", "-", f"{self._container_id}:{posixpath.dirname(target)}"]
+        returncode, _, stderr = await run_command(*cmd, input=archive)
+        if returncode != 0:
+            raise RuntimeError(f"Failed to write file: {stderr.decode()}")
 
     async def read_file(
         self,
         sandbox_id: str,
         path: str,
+        *,
+        binary: bool = False,
     ) -> str | bytes:
-        """Read a file from the container."""
+        """Read a file from the container.
+
+        With ``binary=True`` the raw bytes are returned without decoding.
+        """
+        api = self._engine_api()
+        if api is not None:
+            try:
+                resp = await api.get(
+                    f"/containers/{self._container_id}/archive",
+                    params={"path": posixpath.join("/", path)},
+                )
+                if resp.status_code == 200:
+                    with tarfile.open(fileobj=io.BytesIO(resp.content)) as tar:
+                        member = tar.next()
+                        f = tar.extractfile(member) if member is not None else None
+                        if f is not None:
+                            data = f.read()
+                            return data if binary else data.decode('utf-8')
+            except (httpx.RequestError, tarfile.TarError):
+                pass
+
         cmd = ["docker", "exec", self._container_id, "cat", path]
-        result = subprocess.run(cmd, capture_output=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to read file: {result.stderr.decode()}")
-        return result.stdout.decode('utf-8')
+        returncode, stdout, stderr = await run_command(*cmd)
+        if returncode != 0:
+            raise RuntimeError(f"Failed to read file: {stderr.decode()}")
+        return stdout if binary else stdout.decode('utf-8')
 
     async def destroy(self, sandbox_id: str) -> None:
         """Stop and remove the container."""
+        await self._stop_events()
         if self._container_id:
-            subprocess.run(["docker", "rm", "-f", self._container_id], capture_output=True)
+            await run_command("docker", "rm", "-f", self._container_id)
             self._container_id = None
+            self._status_cache = None
+        if self._engine_client is not None:
+            await self._engine_client.aclose()
+            self._engine_client = None
 
     async def get_status(self, sandbox_id: str) -> str:
-        """Get container status."""
+        """Get container status.
+
+        Served from the events stream when it's running, otherwise from
+        `docker inspect` (cached for STATUS_TTL seconds).
+        """
         if not self._container_id:
             return "stopped"
+        status = self._container_state.get(self._container_id)
+        if status is not None:
+            return status
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and cached[0] == self._container_id and now - cached[1] < self.STATUS_TTL:
+            return cached[2]
         cmd = ["docker", "inspect", "-f", "{{.State.Status}}", self._container_id]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.stdout.strip() if result.returncode == 0 else "unknown"
+        returncode, stdout, _ = await run_command(*cmd)
+        status = stdout.strip().decode("ascii") if returncode == 0 else "unknown"
+        self._status_cache = (self._container_id, now, status)
+        return status
 
 
 register_provider(DockerImageProvider)
@@ -6,7 +6,18 @@ import os
 import shlex
 from typing import Optional
 
-from ..provider import SandboxProvider, ProviderInfo, register_provider
+from ..provider import SandboxProvider, ProviderInfo, cap_output, register_provider
+
+# Prefer the code interpreter SDK (adds run_code); fall back to plain e2b
+try:
+    from e2b_code_interpreter import Sandbox as _Sandbox
+    _HAS_CODE_INTERPRETER = True
+except ImportError:
+    _HAS_CODE_INTERPRETER = False
+    try:
+        from e2b import Sandbox as _Sandbox
+    except ImportError:
+        _Sandbox = None
 
 
 class E2BProvider(SandboxProvider):
@@ -22,11 +33,13 @@ class E2BProvider(SandboxProvider):
         openapi_spec=True,
         llms_txt=False,
     )
+    reuse_auth = True
 
     def __init__(self):
         self._sandboxes: dict[str, object] = {}
         self._api_key = None
         self._has_code_interpreter = False
+        self._execute_python = self._execute_python_cmd
 
     def _get(self, sandbox_id: str):
         """Get sandbox by ID."""
@@ -37,21 +50,17 @@ class E2BProvider(SandboxProvider):
 
     async def authenticate(self, api_key: str) -> None:
         """Authenticate with E2B."""
-        try:
-            from e2b_code_interpreter import Sandbox  # noqa: F401
-            self._has_code_interpreter = True
-            self._api_key = api_key
-            os.environ["E2B_API_KEY"] = api_key
-            if not api_key:
-                raise ValueError("E2B API key required")
-        except ImportError:
-            try:
-                from e2b import Sandbox  # noqa: F401
-                self._has_code_interpreter = False
-                self._api_key = api_key
-                os.environ["E2B_API_KEY"] = api_key
-            except ImportError:
-                raise ImportError("e2b package required: pip install e2b")
+        if _Sandbox is None:
+            raise ImportError("e2b package required: pip install e2b")
+        self._has_code_interpreter = _HAS_CODE_INTERPRETER
+        # Pick the Python path once rather than re-checking on every execute
+        self._execute_python = (
+            self._execute_python_ci if _HAS_CODE_INTERPRETER else self._execute_python_cmd
+        )
+        self._api_key = api_key
+        os.environ["E2B_API_KEY"] = api_key
+        if _HAS_CODE_INTERPRETER and not api_key:
+            raise ValueError("E2B API key required")
 
     async def create_sandbox(
         self,
@@ -59,12 +68,7 @@ class E2BProvider(SandboxProvider):
         timeout_seconds: int = 300,
     ) -> str:
         """Create an E2B sandbox."""
-        if self._has_code_interpreter:
-            from e2b_code_interpreter import Sandbox
-        else:
-            from e2b import Sandbox
-
-        sb = Sandbox.create(timeout=timeout_seconds)
+        sb = _Sandbox.create(timeout=timeout_seconds)
         self._count_api_call()
         self._sandboxes[sb.sandbox_id] = sb
         return sb.sandbox_id
@@ -78,38 +82,48 @@ class E2BProvider(SandboxProvider):
     ) -> tuple[str, str, int]:
         """Execute code in E2B sandbox."""
         sb = self._get(sandbox_id)
-        if language == "python" and self._has_code_interpreter:
-            execution = sb.run_code(code)
-            self._count_api_call()
-            stdout = ""
-            stderr = ""
-            if execution.logs:
-                stdout = "\n".join(execution.logs.stdout) if execution.logs.stdout else ""
-                stderr = "\n".join(execution.logs.stderr) if execution.logs.stderr else ""
-            if execution.error:
-                stderr += str(execution.error)
-            return (stdout, stderr, 0 if not execution.error else 1)
-        elif language == "python":
-            cmd = f"python3 -c {shlex.quote(code)}"
-            result = sb.commands.run(cmd, timeout=timeout_seconds)
-            self._count_api_call()
-            return (result.stdout or "", result.stderr or "", result.exit_code)
-        else:
-            result = sb.commands.run(code, timeout=timeout_seconds)
-            self._count_api_call()
-            return (result.stdout or "", result.stderr or "", result.exit_code)
+        if language == "python":
+            return self._execute_python(sb, code, timeout_seconds)
+        return self._execute_shell(sb, code, timeout_seconds)
+
+    def _execute_python_ci(self, sb, code: str, timeout_seconds: int) -> tuple[str, str, int]:
+        """Run Python through the code interpreter's run_code."""
+        execution = sb.run_code(code)
+        self._count_api_call()
+        stdout = ""
+        stderr = ""
+        if execution.logs:
+            stdout = "\n".join(execution.logs.stdout) if execution.logs.stdout else ""
+            stderr = "\n".join(execution.logs.stderr) if execution.logs.stderr else ""
+        if execution.error:
+            stderr += str(execution.error)
+        return (stdout, stderr, 0 if not execution.error else 1)
+
+    def _execute_python_cmd(self, sb, code: str, timeout_seconds: int) -> tuple[str, str, int]:
+        """Run Python as a python3 -c command."""
+        return self._execute_shell(sb, f"python3 -c {shlex.quote(code)}", timeout_seconds)
+
+    def _execute_shell(self, sb, cmd: str, timeout_seconds: int) -> tuple[str, str, int]:
+        """Run a shell command via the commands API."""
+        result = sb.commands.run(cmd, timeout=timeout_seconds)
+        self._count_api_call()
+        return (result.stdout or "", result.stderr or "", result.exit_code)
 
     async def execute_command(
         self,
         sandbox_id: str,
         command: str,
         timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
         """Execute a shell command directly via E2B commands API."""
         sb = self._get(sandbox_id)
         result = sb.commands.run(command, timeout=timeout_seconds)
         self._count_api_call()
-        return (result.stdout or "", result.stderr or "", result.exit_code)
+        return cap_output(
+            (result.stdout or "", result.stderr or "", result.exit_code),
+            max_output_bytes,
+        )
 
     async def write_file(
         self,
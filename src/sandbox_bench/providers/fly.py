@@ -23,9 +23,14 @@ class FlyProvider(SandboxProvider):
         llms_txt=True,
     )
 
+    # Cap on Sprites API calls in flight at once, so bursts of concurrent
+    # creates/execs/file transfers queue locally instead of tripping rate limits
+    MAX_CONCURRENT_CALLS = 20
+
     def __init__(self):
         self._client = None
         self._sprites: dict[str, object] = {}
+        self._api_slots = asyncio.Semaphore(self.MAX_CONCURRENT_CALLS)
 
     async def authenticate(self, api_key: str) -> None:
         """Authenticate with Sprites.dev using a SPRITE_TOKEN."""
@@ -53,7 +58,8 @@ class FlyProvider(SandboxProvider):
         """Create a new Sprite."""
         name = f"bench-{uuid.uuid4().hex[:8]}"
 
-        sprite = await asyncio.to_thread(self._client.create_sprite, name)
+        async with self._api_slots:
+            sprite = await asyncio.to_thread(self._client.create_sprite, name)
         self._count_api_call()
         self._sprites[name] = sprite
 
@@ -79,17 +85,24 @@ class FlyProvider(SandboxProvider):
         sandbox_id: str,
         command: str,
         timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
         """Execute a shell command in a Sprite."""
-        return await self._run_cmd(sandbox_id, ("bash", "-c", command), timeout_seconds)
+        return await self._run_cmd(
+            sandbox_id, ("bash", "-c", command), timeout_seconds, max_output_bytes
+        )
 
     async def _run_cmd(
         self,
         sandbox_id: str,
         args: tuple[str, ...],
         timeout: int,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
-        """Run a command and return (stdout, stderr, exit_code)."""
+        """Run a command and return (stdout, stderr, exit_code).
+
+        Output past max_output_bytes is dropped before it is decoded.
+        """
         sprite = self._get_sprite(sandbox_id)
 
         def _exec():
@@ -99,11 +112,12 @@ class FlyProvider(SandboxProvider):
             cmd._capture_stderr = True
             # _run_sync sets _started and handles the full lifecycle
             exit_code = cmd._run_sync()
-            stdout = (cmd._stdout_data or b"").decode("utf-8", errors="replace")
-            stderr = (cmd._stderr_data or b"").decode("utf-8", errors="replace")
+            stdout = (cmd._stdout_data or b"")[:max_output_bytes].decode("utf-8", errors="replace")
+            stderr = (cmd._stderr_data or b"")[:max_output_bytes].decode("utf-8", errors="replace")
             return (stdout, stderr, exit_code)
 
-        result = await asyncio.to_thread(_exec)
+        async with self._api_slots:
+            result = await asyncio.to_thread(_exec)
         self._count_api_call()
         return result
 
@@ -124,7 +138,8 @@ class FlyProvider(SandboxProvider):
             else:
                 p.write_text(content, mkdir_parents=True)
 
-        await asyncio.to_thread(_write)
+        async with self._api_slots:
+            await asyncio.to_thread(_write)
         self._count_api_call()
 
     async def read_file(
@@ -139,7 +154,8 @@ class FlyProvider(SandboxProvider):
             fs = sprite.filesystem("/")
             return fs.path(path).read_text()
 
-        result = await asyncio.to_thread(_read)
+        async with self._api_slots:
+            result = await asyncio.to_thread(_read)
         self._count_api_call()
         return result
 
@@ -148,7 +164,8 @@ class FlyProvider(SandboxProvider):
         sprite = self._sprites.pop(sandbox_id, None)
         if sprite is not None:
             try:
-                await asyncio.to_thread(sprite.destroy)
+                async with self._api_slots:
+                    await asyncio.to_thread(sprite.destroy)
                 self._count_api_call()
             except Exception:
                 pass
@@ -14,13 +14,35 @@ import os
 import shlex
 import subprocess
 import sys
-import time
+import tempfile
 import uuid
 from typing import Optional
 
 import httpx
 
-from ..provider import SandboxProvider, ProviderInfo, register_provider
+from ..provider import (
+    SandboxProvider,
+    ProviderInfo,
+    get_http_client,
+    register_provider,
+    run_command,
+)
+
+# /execute bodies can carry large program output; use orjson when installed
+try:
+    import orjson
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+else:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class MicroVMProvider(SandboxProvider):
@@ -36,12 +58,14 @@ class MicroVMProvider(SandboxProvider):
         openapi_spec=False,
         llms_txt=False,
     )
+    reuse_auth = True
 
     def __init__(self):
         self._process: Optional[subprocess.Popen] = None
         self._vm_id: Optional[str] = None
         self._command: Optional[str] = None
         self._base_url: Optional[str] = None
+        self._execute_url: Optional[str] = None
         self._ip_address: str = "172.16.0.2"
         self._port: int = 8000
 
@@ -90,6 +114,7 @@ class MicroVMProvider(SandboxProvider):
         )
 
         self._base_url = f"http://{self._ip_address}:{self._port}"
+        self._execute_url = f"{self._base_url}/execute"
 
         # Wait for ready
         await self._wait_for_ready(timeout_seconds=60)
@@ -97,21 +122,33 @@ class MicroVMProvider(SandboxProvider):
 
     async def _wait_for_ready(self, timeout_seconds: int = 60) -> None:
         """Wait for the VM to be ready."""
-        start = time.time()
-        async with httpx.AsyncClient() as client:
-            while time.time() - start < timeout_seconds:
-                # Check if process died
-                if self._process and self._process.poll() is not None:
-                    stderr = self._process.stderr.read().decode() if self._process.stderr else ""
-                    raise RuntimeError(f"VM process died: {stderr}")
-
-                try:
-                    resp = await client.get(f"{self._base_url}/health", timeout=2)
-                    if resp.status_code == 200:
-                        return
-                except httpx.RequestError:
-                    pass
-                await asyncio.sleep(0.5)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        client = get_http_client()
+        # Poll quickly while the VM is likely still booting, backing off to 1s.
+        # A refused connection means the server isn't up yet and costs almost
+        # nothing to retry, so keep those polls tight.
+        delay = 0.05
+        while loop.time() < deadline:
+            # Check if process died
+            if self._process and self._process.poll() is not None:
+                stderr = self._process.stderr.read().decode() if self._process.stderr else ""
+                raise RuntimeError(f"VM process died: {stderr}")
+
+            wait = None
+            try:
+                resp = await client.get(f"{self._base_url}/health", timeout=2)
+                if resp.status_code == 200:
+                    return
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    wait = float(retry_after)
+            except httpx.ConnectError:
+                delay = min(delay, 0.1)
+            except httpx.RequestError:
+                pass
+            await asyncio.sleep(min(wait if wait is not None else delay, max(deadline - loop.time(), 0)))
+            delay = min(delay * 1.5, 1.0)
         raise RuntimeError(f"VM not ready after {timeout_seconds}s")
 
     async def execute(
@@ -122,35 +159,36 @@ class MicroVMProvider(SandboxProvider):
         timeout_seconds: int = 30,
     ) -> tuple[str, str, int]:
         """Execute code in the VM."""
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.post(
-                    f"{self._base_url}/execute",
-                    json={"code": code, "language": language},
-                    timeout=timeout_seconds
+        client = get_http_client()
+        try:
+            resp = await client.post(
+                self._execute_url,
+                content=_dumps({"code": code, "language": language}),
+                headers=_JSON_HEADERS,
+                timeout=timeout_seconds
+            )
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                return (
+                    data.get("stdout", ""),
+                    data.get("stderr", ""),
+                    data.get("exit_code", 0)
                 )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return (
-                        data.get("stdout", ""),
-                        data.get("stderr", ""),
-                        data.get("exit_code", 0)
-                    )
-            except httpx.RequestError:
-                pass
+        except httpx.RequestError:
+            pass
 
         # Fall back to SSH
-        ssh_cmd = [
-            "ssh", "-o", "StrictHostKeyChecking=no",
-            "-o", "UserKnownHostsFile=/dev/null",
-            "-o", "ConnectTimeout=5",
-            f"root@{self._ip_address}",
+        ssh_cmd = self._ssh_command(
             f"python3 -c {repr(code)}" if language == "python" else code
-        ]
+        )
 
         try:
-            result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=timeout_seconds)
-            return (result.stdout, result.stderr, result.returncode)
+            returncode, stdout, stderr = await run_command(*ssh_cmd, timeout=timeout_seconds)
+            return (
+                stdout.decode(errors="replace"),
+                stderr.decode(errors="replace"),
+                returncode,
+            )
         except subprocess.TimeoutExpired:
             return ("", f"Timeout after {timeout_seconds}s", 1)
         except Exception as e:
@@ -166,22 +204,10 @@ class MicroVMProvider(SandboxProvider):
         if isinstance(content, str):
             content = content.encode('utf-8')
 
-        import tempfile
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(content)
-            temp_path = f.name
-
-        try:
-            cmd = [
-                "scp", "-o", "StrictHostKeyChecking=no",
-                "-o", "UserKnownHostsFile=/dev/null",
-                temp_path, f"root@{self._ip_address}:{path}"
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to write file: {result.stderr}")
-        finally:
-            os.remove(temp_path)
+        cmd = self._ssh_command(f"cat > {shlex.quote(path)}")
+        returncode, _, stderr = await run_command(*cmd, timeout=30, input=content)
+        if returncode != 0:
+            raise RuntimeError(f"Failed to write file: {stderr.decode()}")
 
     async def read_file(
         self,
@@ -189,22 +215,46 @@ class MicroVMProvider(SandboxProvider):
         path: str,
     ) -> str | bytes:
         """Read a file from the VM."""
-        cmd = [
+        cmd = self._ssh_command(f"cat {shlex.quote(path)}")
+        returncode, stdout, stderr = await run_command(*cmd, timeout=30)
+        if returncode != 0:
+            raise RuntimeError(f"Failed to read file: {stderr.decode()}")
+        return stdout.decode('utf-8')
+
+    def _ssh_command(self, remote_command: str) -> list[str]:
+        """Build an ssh invocation for the VM.
+
+        Calls share one multiplexed master connection (ControlMaster), so
+        only the first pays for the TCP handshake and SSH key exchange.
+        """
+        return [
             "ssh", "-o", "StrictHostKeyChecking=no",
             "-o", "UserKnownHostsFile=/dev/null",
-            f"root@{self._ip_address}", f"cat {path}"
+            "-o", "ConnectTimeout=5",
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={self._control_path()}",
+            "-o", "ControlPersist=60",
+            f"root@{self._ip_address}",
+            remote_command,
         ]
-        result = subprocess.run(cmd, capture_output=True, timeout=30)
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to read file: {result.stderr.decode()}")
-        return result.stdout.decode('utf-8')
+
+    def _control_path(self) -> str:
+        """Socket path of the VM's shared SSH master connection."""
+        return os.path.join(tempfile.gettempdir(), f"sandbox-bench-{self._vm_id}.ssh")
 
     async def destroy(self, sandbox_id: str) -> None:
         """Stop the VM."""
+        if self._vm_id and os.path.exists(self._control_path()):
+            cmd = ["ssh", "-o", f"ControlPath={self._control_path()}", "-O", "exit",
+                   f"root@{self._ip_address}"]
+            try:
+                await run_command(*cmd, timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
         if self._process:
             self._process.terminate()
             try:
-                self._process.wait(timeout=5)
+                await asyncio.to_thread(self._process.wait, 5)
             except subprocess.TimeoutExpired:
                 self._process.kill()
             self._process = None
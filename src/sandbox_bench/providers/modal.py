@@ -3,10 +3,36 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import json
 import os
+import shlex
 from typing import Optional
 
-from ..provider import SandboxProvider, ProviderInfo, register_provider
+from ..provider import SandboxProvider, ProviderInfo, cap_output, register_provider
+
+# Scripts run inside the sandbox to move many files in a single exec. Writes
+# take (path, size) pairs as a JSON argv entry and the raw contents back to
+# back on stdin, since a single argv entry is capped at 128 KiB; reads return
+# base64 contents as JSON
+_WRITE_FILES_SCRIPT = (
+    "import json,os,sys\n"
+    "for p,n in json.loads(sys.argv[1]):\n"
+    "    os.makedirs(os.path.dirname(p) or '.', exist_ok=True)\n"
+    "    open(p,'wb').write(sys.stdin.buffer.read(n))\n"
+)
+_READ_FILES_SCRIPT = (
+    "import base64,json,sys\n"
+    "print(json.dumps([base64.b64encode(open(p,'rb').read()).decode() for p in sys.argv[1:]]))\n"
+)
+
+
+def _text_or_bytes(data: bytes) -> str | bytes:
+    """Decode file contents as text, keeping binary files as bytes."""
+    try:
+        return data.decode()
+    except UnicodeDecodeError:
+        return data
 
 
 class ModalProvider(SandboxProvider):
@@ -22,6 +48,7 @@ class ModalProvider(SandboxProvider):
         openapi_spec=False,
         llms_txt=True,
     )
+    reuse_auth = True
 
     def __init__(self):
         self._sandboxes: dict[str, object] = {}
@@ -96,6 +123,7 @@ class ModalProvider(SandboxProvider):
         sandbox_id: str,
         command: str,
         timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
         """Execute a shell command in Modal sandbox."""
         sb = self._get(sandbox_id)
@@ -105,7 +133,7 @@ class ModalProvider(SandboxProvider):
             process.wait()
             stdout = process.stdout.read()
             stderr = process.stderr.read()
-            return (stdout, stderr, process.returncode)
+            return cap_output((stdout, stderr, process.returncode), max_output_bytes)
 
         result = await asyncio.to_thread(_exec)
         self._count_api_call()
@@ -117,20 +145,23 @@ class ModalProvider(SandboxProvider):
         path: str,
         content: str | bytes,
     ) -> None:
-        """Write file to Modal sandbox."""
+        """Write file to Modal sandbox, streaming the raw bytes over stdin."""
         sb = self._get(sandbox_id)
         if isinstance(content, str):
             content = content.encode()
 
-        import base64
-        b64 = base64.b64encode(content).decode()
+        quoted = shlex.quote(path)
 
         def _write():
             process = sb.exec(
-                "python", "-c",
-                f"import base64,os; os.makedirs(os.path.dirname('{path}') or '.', exist_ok=True); open('{path}', 'wb').write(base64.b64decode('{b64}'))"
+                "sh", "-c", f"mkdir -p \"$(dirname {quoted})\" && cat > {quoted}"
             )
+            process.stdin.write(content)
+            process.stdin.write_eof()
+            process.stdin.drain()
             process.wait()
+            if process.returncode != 0:
+                raise RuntimeError(f"Failed to write file: {process.stderr.read()}")
 
         await asyncio.to_thread(_write)
         self._count_api_call()
@@ -152,6 +183,51 @@ class ModalProvider(SandboxProvider):
         self._count_api_call()
         return result
 
+    async def write_files(
+        self,
+        sandbox_id: str,
+        files: list[tuple[str, str | bytes]],
+    ) -> None:
+        """Write several files to Modal sandbox with one exec."""
+        sb = self._get(sandbox_id)
+        blobs = [
+            (path, content.encode() if isinstance(content, str) else content)
+            for path, content in files
+        ]
+        sizes = json.dumps([(path, len(data)) for path, data in blobs])
+
+        def _write():
+            process = sb.exec("python", "-c", _WRITE_FILES_SCRIPT, sizes)
+            for _, data in blobs:
+                process.stdin.write(data)
+            process.stdin.write_eof()
+            process.stdin.drain()
+            process.wait()
+            if process.returncode != 0:
+                raise RuntimeError(f"Failed to write files: {process.stderr.read()}")
+
+        await asyncio.to_thread(_write)
+        self._count_api_call()
+
+    async def read_files(
+        self,
+        sandbox_id: str,
+        paths: list[str],
+    ) -> list[str | bytes]:
+        """Read several files from Modal sandbox with one exec."""
+        sb = self._get(sandbox_id)
+
+        def _read():
+            process = sb.exec("python", "-c", _READ_FILES_SCRIPT, *paths)
+            process.wait()
+            if process.returncode != 0:
+                raise RuntimeError(f"Failed to read files: {process.stderr.read()}")
+            return process.stdout.read()
+
+        out = await asyncio.to_thread(_read)
+        self._count_api_call()
+        return [_text_or_bytes(base64.b64decode(d)) for d in json.loads(out)]
+
     async def destroy(self, sandbox_id: str) -> None:
         """Terminate Modal sandbox."""
         sb = self._sandboxes.pop(sandbox_id, None)
@@ -40,6 +40,7 @@ class VMVMProvider(SandboxProvider):
         openapi_spec=False,
         llms_txt=False,
     )
+    reuse_auth = True
 
     def __init__(self):
         self._tenant_id: Optional[str] = None
@@ -142,10 +143,10 @@ class VMVMProvider(SandboxProvider):
             session_id_str = None
             ssh_port = None
 
-            deadline = time.time() + timeout_seconds
+            deadline = time.monotonic() + timeout_seconds
             lines_read = 0
 
-            while time.time() < deadline and lines_read < 3:
+            while time.monotonic() < deadline and lines_read < 3:
                 # Check if process died
                 if proc.poll() is not None:
                     stderr = proc.stderr.read().decode() if proc.stderr else ""
@@ -156,7 +157,7 @@ class VMVMProvider(SandboxProvider):
                     )
 
                 # Non-blocking readline
-                line = await asyncio.get_event_loop().run_in_executor(
+                line = await asyncio.get_running_loop().run_in_executor(
                     None, proc.stdout.readline
                 )
                 if not line:
@@ -220,18 +221,21 @@ class VMVMProvider(SandboxProvider):
     ) -> None:
         """Wait for SSH to become available and establish a persistent connection."""
         port = self._ssh_ports[sandbox_id]
-        start = time.time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        delay = 0.1
 
-        while time.time() - start < timeout_seconds:
+        while loop.time() < deadline:
             try:
-                client = await asyncio.get_event_loop().run_in_executor(
+                client = await loop.run_in_executor(
                     None, self._connect_ssh, port
                 )
                 self._ssh_clients[sandbox_id] = client
                 self._count_api_call()
                 return
             except Exception:
-                await asyncio.sleep(0.5)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 2.0)
 
         raise RuntimeError(f"SSH not ready after {timeout_seconds}s")
 
@@ -240,16 +244,20 @@ class VMVMProvider(SandboxProvider):
         sandbox_id: str,
         command: str,
         timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
-        """Execute a command via SSH (blocking, runs in executor)."""
+        """Execute a command via SSH (blocking, runs in executor).
+
+        Reads at most max_output_bytes from each of stdout and stderr.
+        """
         client = self._get_ssh(sandbox_id)
         stdin_ch, stdout_ch, stderr_ch = client.exec_command(
             command, timeout=timeout_seconds
         )
         # Wait for command to complete
         exit_code = stdout_ch.channel.recv_exit_status()
-        stdout = stdout_ch.read().decode("utf-8", errors="replace")
-        stderr = stderr_ch.read().decode("utf-8", errors="replace")
+        stdout = stdout_ch.read(max_output_bytes).decode("utf-8", errors="replace")
+        stderr = stderr_ch.read(max_output_bytes).decode("utf-8", errors="replace")
         return (stdout, stderr, exit_code)
 
     async def execute(
@@ -266,7 +274,7 @@ class VMVMProvider(SandboxProvider):
             remote_cmd = code
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: self._exec_ssh_command(
                     sandbox_id, remote_cmd, timeout_seconds
@@ -285,13 +293,14 @@ class VMVMProvider(SandboxProvider):
         sandbox_id: str,
         command: str,
         timeout_seconds: int = 30,
+        max_output_bytes: Optional[int] = None,
     ) -> tuple[str, str, int]:
         """Execute a shell command in the VM via SSH."""
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: self._exec_ssh_command(
-                    sandbox_id, command, timeout_seconds
+                    sandbox_id, command, timeout_seconds, max_output_bytes
                 ),
             )
             self._count_api_call()
@@ -328,7 +337,7 @@ class VMVMProvider(SandboxProvider):
             finally:
                 sftp.close()
 
-        await asyncio.get_event_loop().run_in_executor(None, _write)
+        await asyncio.get_running_loop().run_in_executor(None, _write)
         self._count_api_call()
 
     async def read_file(
@@ -347,7 +356,7 @@ class VMVMProvider(SandboxProvider):
             finally:
                 sftp.close()
 
-        result = await asyncio.get_event_loop().run_in_executor(None, _read)
+        result = await asyncio.get_running_loop().run_in_executor(None, _read)
         self._count_api_call()
         return result
 
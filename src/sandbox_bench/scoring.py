@@ -1,6 +1,8 @@
 """Scoring and grading logic."""
 
-from typing import TYPE_CHECKING
+from bisect import bisect_right
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, List
 
 if TYPE_CHECKING:
     from .benchmark import BenchmarkResult
@@ -35,6 +37,29 @@ WEIGHTS_BASE = {
 }
 
 
+# Lower-is-better metrics: (result attribute, normalization max, weight key)
+_PENALTY_METRICS = (
+    ("total_time_seconds", MAX_TIME_SECONDS, "time"),
+    ("tool_calls", MAX_TOOL_CALLS, "tool_calls"),
+    ("friction_points", MAX_FRICTION, "friction"),
+    ("errors", MAX_ERRORS, "errors"),
+    ("estimated_cost_usd", MAX_COST_USD, "cost"),
+)
+
+
+def _scoring_plan(weights: dict) -> tuple:
+    """Resolve a weight set into (metric getter, (max, weight) pairs,
+    discoverability weight, capabilities weight or None) once, so scoring a
+    result is one attribute fetch and a flat loop."""
+    getter = attrgetter(*(attr for attr, _, _ in _PENALTY_METRICS))
+    terms = tuple((max_value, weights[key]) for _, max_value, key in _PENALTY_METRICS)
+    return getter, terms, weights["discoverability"], weights.get("capabilities")
+
+
+_PLAN_FULL = _scoring_plan(WEIGHTS_FULL)
+_PLAN_BASE = _scoring_plan(WEIGHTS_BASE)
+
+
 def normalize(value: float, max_value: float) -> float:
     """Normalize a value to 0-1 range (0 is best)."""
     return min(1.0, value / max_value)
@@ -52,6 +77,11 @@ def _get_weights(result: "BenchmarkResult") -> dict:
     return WEIGHTS_BASE
 
 
+def _plan_for(result: "BenchmarkResult") -> tuple:
+    """Scoring plan for a result (same choice as _get_weights)."""
+    return _PLAN_FULL if getattr(result, "capabilities", None) else _PLAN_BASE
+
+
 def calculate_score(result: "BenchmarkResult") -> float:
     """
     Calculate overall score from benchmark result.
@@ -62,38 +92,34 @@ def calculate_score(result: "BenchmarkResult") -> float:
     if not result.success:
         return 0.0
 
-    weights = _get_weights(result)
+    getter, terms, discoverability_weight, capabilities_weight = _plan_for(result)
 
-    # Normalize each metric (lower is better for most)
-    time_norm = normalize(result.total_time_seconds, MAX_TIME_SECONDS)
-    calls_norm = normalize(result.tool_calls, MAX_TOOL_CALLS)
-    friction_norm = normalize(result.friction_points, MAX_FRICTION)
-    errors_norm = normalize(result.errors, MAX_ERRORS)
-    cost_norm = normalize(result.estimated_cost_usd, MAX_COST_USD)
+    # For most metrics, (1 - normalized) because lower is better
+    score = 0.0
+    for value, (max_value, weight) in zip(getter(result), terms):
+        score += (1 - min(1.0, value / max_value)) * weight
 
     # Discoverability is already 1-5, normalize to 0-1 (higher is better)
-    discoverability_norm = result.discoverability_score / 5.0
-
-    # Calculate weighted score
-    # For most metrics, (1 - normalized) because lower is better
-    # For discoverability, use directly because higher is better
-    score = (
-        (1 - time_norm) * weights["time"]
-        + (1 - calls_norm) * weights["tool_calls"]
-        + (1 - friction_norm) * weights["friction"]
-        + (1 - errors_norm) * weights["errors"]
-        + (1 - cost_norm) * weights["cost"]
-        + discoverability_norm * weights["discoverability"]
-    )
+    score += result.discoverability_score / 5.0 * discoverability_weight
 
     # Add capabilities component if present
-    if "capabilities" in weights:
+    if capabilities_weight is not None:
         cap_score = getattr(result, "capability_score", 0.0)
-        score += cap_score * weights["capabilities"]
+        score += cap_score * capabilities_weight
 
     return round(score * 100, 1)
 
 
+def calculate_scores(results: Iterable["BenchmarkResult"]) -> List[float]:
+    """Calculate scores for many benchmark results (see calculate_score)."""
+    return [calculate_score(result) for result in results]
+
+
+# Lower score bound of each grade above F, ascending, and the grades they map to
+_GRADE_BOUNDS = (40, 55, 70, 85)
+_GRADES = "FDCBA"
+
+
 def calculate_grade(score: float) -> str:
     """
     Convert score to letter grade.
@@ -104,13 +130,9 @@ def calculate_grade(score: float) -> str:
     Returns:
         Letter grade (A, B, C, D, F)
     """
-    if score >= 85:
-        return "A"
-    elif score >= 70:
-        return "B"
-    elif score >= 55:
-        return "C"
-    elif score >= 40:
-        return "D"
-    else:
-        return "F"
+    return _GRADES[bisect_right(_GRADE_BOUNDS, score)]
+
+
+def calculate_grades(scores: Iterable[float]) -> List[str]:
+    """Convert many scores to letter grades (see calculate_grade)."""
+    return [_GRADES[bisect_right(_GRADE_BOUNDS, score)] for score in scores]
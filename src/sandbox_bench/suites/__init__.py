@@ -1,13 +1,17 @@
 """Test suite framework for sandbox-bench."""
 
+import importlib
+import sys
+import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Type
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Type, Union
 
 from ..provider import SandboxProvider
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PhaseResult:
     """Result from a single test phase within a suite."""
 
@@ -30,6 +34,10 @@ class TestSuite(ABC):
 
     name: str = "base"
     description: str = ""
+    # Unscored suites run after the scored ones; their time, API calls,
+    # friction and errors are reported in suite_results but kept out of
+    # the totals the score is computed from
+    scored: bool = True
 
     @abstractmethod
     async def run(
@@ -49,24 +57,150 @@ class TestSuite(ABC):
         pass
 
 
+async def batch_file_ops(
+    provider: SandboxProvider,
+    sandbox_id: str,
+    writes: Optional[Dict[str, Union[str, bytes]]] = None,
+    reads: Sequence[str] = (),
+) -> List[Union[str, bytes]]:
+    """Run independent file operations as one batch of writes, then reads.
+
+    Goes through the provider's write_files()/read_files(), which run the
+    operations concurrently or in a single round trip. All writes finish
+    before the reads start, so a read may safely target a path written in
+    the same batch.
+
+    Args:
+        provider: The sandbox provider to use.
+        sandbox_id: ID of the sandbox to operate on.
+        writes: Mapping of path to content to write.
+        reads: Paths to read once the writes have completed.
+
+    Returns:
+        Contents of ``reads``, in order.
+    """
+    if writes:
+        await provider.write_files(sandbox_id, list(writes.items()))
+    if not reads:
+        return []
+    return await provider.read_files(sandbox_id, list(reads))
+
+
+class PhaseRecorder:
+    """Mutable state of a capability-probe phase timed by timed_phase()."""
+
+    __slots__ = (
+        "name", "capability", "tool_calls", "failure_friction", "success",
+        "details", "error_messages", "duration_seconds",
+    )
+
+    def __init__(
+        self, name: str, capability: str, tool_calls: int, failure_friction: int
+    ):
+        self.name = name
+        self.capability = capability
+        self.tool_calls = tool_calls
+        self.failure_friction = failure_friction
+        self.success = False
+        self.details: Dict = {}
+        self.error_messages: List[str] = []
+        self.duration_seconds = 0.0
+
+    def result(self) -> PhaseResult:
+        """Build the PhaseResult; a failed probe counts failure_friction."""
+        return PhaseResult(
+            name=self.name,
+            success=self.success,
+            duration_seconds=self.duration_seconds,
+            tool_calls=self.tool_calls,
+            friction_points=0 if self.success else self.failure_friction,
+            capability_tested=self.capability,
+            capability_supported=self.success,
+            error_messages=self.error_messages,
+            details=self.details,
+        )
+
+
+@asynccontextmanager
+async def timed_phase(
+    name: str,
+    capability: str,
+    tool_calls: int = 1,
+    failure_friction: int = 1,
+) -> AsyncIterator[PhaseRecorder]:
+    """Time a capability-probe phase, recording an exception as a failure.
+
+    Set ``success`` (and ``details``) on the yielded recorder inside the
+    block, then return its ``result()`` after it. A probe that runs but
+    fails counts ``failure_friction``; an exception always counts one.
+    """
+    phase = PhaseRecorder(name, capability, tool_calls, failure_friction)
+    t0 = time.perf_counter()
+    try:
+        yield phase
+    except Exception as e:
+        phase.success = False
+        phase.failure_friction = 1
+        phase.details = {}
+        phase.error_messages.append(str(e))
+    finally:
+        phase.duration_seconds = time.perf_counter() - t0
+
+
 # Suite registry
 _suites: Dict[str, Type[TestSuite]] = {}
 
+# Suites registered by name only; their module is imported (and registers
+# the class) on first lookup, so `sandbox-bench suites` imports none of them
+_lazy_suites: Dict[str, str] = {}
+
 
 def register_suite(suite_class: Type[TestSuite]) -> None:
     """Register a test suite class."""
-    _suites[suite_class.name] = suite_class
+    _suites[sys.intern(suite_class.name)] = suite_class
+
+
+def register_lazy_suite(name: str, module: str) -> None:
+    """Register a suite by name, deferring import of its module.
+
+    Args:
+        name: Suite name (the class's ``name`` attribute)
+        module: Absolute module path that calls register_suite() on import
+    """
+    _lazy_suites[sys.intern(name)] = module
 
 
 def get_suite(name: str) -> Type[TestSuite]:
     """Get a suite class by name."""
-    if name not in _suites:
+    suite_class = _suites.get(name)
+    if suite_class is None and name in _lazy_suites:
+        importlib.import_module(_lazy_suites[name])
+        suite_class = _suites.get(name)
+    if suite_class is None:
         raise ValueError(
-            f"Unknown suite: {name}. Available: {list(_suites.keys())}"
+            f"Unknown suite: {name}. Available: {list_suites()}"
         )
-    return _suites[name]
+    return suite_class
 
 
 def list_suites() -> list[str]:
     """List all registered suite names."""
-    return list(_suites.keys())
+    return list(dict.fromkeys([*_lazy_suites, *_suites]))
+
+
+# Built-in suite name -> module
+_SUITE_MODULES = {
+    "basic": ".basic",
+    "competitive": ".competitive",
+    "swe": ".swe",
+    "environment": ".environment",
+    "performance": ".performance",
+    "mcp": ".mcp",
+    "networking": ".networking",
+    "training_batch": ".training_batch",
+    "agentic_session": ".agentic_session",
+    "throughput": ".throughput",
+}
+
+for _name, _module in _SUITE_MODULES.items():
+    register_lazy_suite(_name, __name__ + _module)
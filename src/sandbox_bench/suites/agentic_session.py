@@ -26,7 +26,7 @@ class AgenticSessionSuite(TestSuite):
         sandbox_id: str,
     ) -> List[PhaseResult]:
         results: List[PhaseResult] = []
-        wall_start = time.time()
+        wall_start = time.perf_counter()
 
         # State shared across phases
         expected_checksum: Optional[str] = None
@@ -109,20 +109,20 @@ class AgenticSessionSuite(TestSuite):
         sandbox_id: str,
     ) -> tuple[PhaseResult, Optional[str]]:
         """Phase 1: Write 2GiB file, compute checksum, allocate 2GiB RAM."""
-        t0 = time.time()
+        t0 = time.perf_counter()
         errors: List[str] = []
         expected_checksum: Optional[str] = None
         details: dict = {}
 
         try:
             # Write 2GiB file
-            t_disk = time.time()
+            t_disk = time.perf_counter()
             stdout, stderr, rc = await provider.execute_command(
                 sandbox_id,
                 "dd if=/dev/urandom of=/tmp/state-2g bs=1M count=2048 2>&1",
                 timeout_seconds=120,
             )
-            details["disk_write_duration_seconds"] = round(time.time() - t_disk, 3)
+            details["disk_write_duration_seconds"] = round(time.perf_counter() - t_disk, 3)
             if rc != 0:
                 errors.append(f"dd failed (rc={rc}): {stderr or stdout}")
 
@@ -139,7 +139,7 @@ class AgenticSessionSuite(TestSuite):
                 errors.append(f"md5sum failed (rc={rc}): {stderr or stdout}")
 
             # Allocate 2GiB RAM via background process
-            t_ram = time.time()
+            t_ram = time.perf_counter()
             stdout, stderr, rc = await provider.execute_command(
                 sandbox_id,
                 (
@@ -151,7 +151,7 @@ class AgenticSessionSuite(TestSuite):
                 ),
                 timeout_seconds=60,
             )
-            details["ram_alloc_duration_seconds"] = round(time.time() - t_ram, 3)
+            details["ram_alloc_duration_seconds"] = round(time.perf_counter() - t_ram, 3)
             if rc != 0:
                 errors.append(f"RAM alloc failed (rc={rc}): {stderr or stdout}")
             else:
@@ -169,7 +169,7 @@ class AgenticSessionSuite(TestSuite):
         except Exception as e:
             errors.append(str(e))
 
-        duration = time.time() - t0
+        duration = time.perf_counter() - t0
         success = len(errors) == 0 and expected_checksum is not None
         details["load_duration_seconds"] = round(duration, 3)
 
@@ -191,7 +191,7 @@ class AgenticSessionSuite(TestSuite):
         sandbox_id: str,
     ) -> tuple[PhaseResult, Optional[str], bool]:
         """Phase 2: Snapshot the sandbox."""
-        t0 = time.time()
+        t0 = time.perf_counter()
         snapshot_id: Optional[str] = None
         supported = True
         errors: List[str] = []
@@ -208,7 +208,7 @@ class AgenticSessionSuite(TestSuite):
         except Exception as e:
             errors.append(str(e))
 
-        duration = time.time() - t0
+        duration = time.perf_counter() - t0
         details["snapshot_duration_seconds"] = round(duration, 3)
         success = snapshot_id is not None
 
@@ -231,29 +231,29 @@ class AgenticSessionSuite(TestSuite):
         snapshot_id: str,
     ) -> tuple[PhaseResult, Optional[str]]:
         """Phase 3: Destroy original sandbox and restore from snapshot."""
-        t0 = time.time()
+        t0 = time.perf_counter()
         new_sandbox_id: Optional[str] = None
         errors: List[str] = []
         details: dict = {}
 
         # Destroy the original
-        t_destroy = time.time()
+        t_destroy = time.perf_counter()
         try:
             await provider.destroy(sandbox_id)
         except Exception as e:
             errors.append(f"destroy failed: {e}")
-        details["destroy_duration_seconds"] = round(time.time() - t_destroy, 3)
+        details["destroy_duration_seconds"] = round(time.perf_counter() - t_destroy, 3)
 
         # Restore from snapshot
-        t_restore = time.time()
+        t_restore = time.perf_counter()
         try:
             new_sandbox_id = await provider.restore(snapshot_id)
             details["new_sandbox_id"] = new_sandbox_id
         except Exception as e:
             errors.append(f"restore failed: {e}")
-        details["restore_duration_seconds"] = round(time.time() - t_restore, 3)
+        details["restore_duration_seconds"] = round(time.perf_counter() - t_restore, 3)
 
-        duration = time.time() - t0
+        duration = time.perf_counter() - t0
         success = new_sandbox_id is not None
 
         return PhaseResult(
@@ -276,7 +276,7 @@ class AgenticSessionSuite(TestSuite):
         wall_start: float,
     ) -> PhaseResult:
         """Phase 4: Verify the restored sandbox has the same state."""
-        t0 = time.time()
+        t0 = time.perf_counter()
         errors: List[str] = []
         details: dict = {}
         checksum_match = False
@@ -309,8 +309,8 @@ class AgenticSessionSuite(TestSuite):
         except Exception as e:
             errors.append(str(e))
 
-        duration = time.time() - t0
-        wall_time = time.time() - wall_start
+        duration = time.perf_counter() - t0
+        wall_time = time.perf_counter() - wall_start
         details["checksum_match"] = checksum_match
         details["ram_survived"] = ram_survived
         details["verify_duration_seconds"] = round(duration, 3)
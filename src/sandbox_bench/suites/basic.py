@@ -31,7 +31,7 @@ class BasicSuite(TestSuite):
     async def _execute_hello(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         tool_calls = 0
         friction = 0
         errors = 0
@@ -50,11 +50,12 @@ class BasicSuite(TestSuite):
                 error_msgs.append(f"Execute returned non-zero: {exit_code}")
                 friction += 1
 
-            if "Hello from sandbox-bench!" not in stdout:
+            greeted = "Hello from sandbox-bench!" in stdout
+            if not greeted:
                 error_msgs.append(f"Unexpected output: {stdout}")
                 friction += 1
 
-            success = exit_code == 0 and "Hello from sandbox-bench!" in stdout
+            success = exit_code == 0 and greeted
         except Exception as e:
             error_msgs.append(f"Execute failed: {e}")
             errors += 1
@@ -63,7 +64,7 @@ class BasicSuite(TestSuite):
         return PhaseResult(
             name="execute_hello",
             success=success,
-            duration_seconds=time.time() - t0,
+            duration_seconds=time.perf_counter() - t0,
             tool_calls=tool_calls,
             friction_points=friction,
             errors=errors,
@@ -74,7 +75,7 @@ class BasicSuite(TestSuite):
     async def _file_io(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         tool_calls = 0
         friction = 0
         errors = 0
@@ -104,7 +105,7 @@ class BasicSuite(TestSuite):
         return PhaseResult(
             name="file_io",
             success=success,
-            duration_seconds=time.time() - t0,
+            duration_seconds=time.perf_counter() - t0,
             tool_calls=tool_calls,
             friction_points=friction,
             errors=errors,
@@ -1,11 +1,19 @@
 """Competitive programming (Baekjoon-style) test suite."""
 
+import asyncio
 import time
 from typing import List
 
-from . import PhaseResult, TestSuite, register_suite
+from . import PhaseResult, TestSuite, register_suite, timed_phase
 from ..provider import SandboxProvider
 
+# Seconds exec_timeout waits for a command given a 3s timeout (the
+# baseline's 8s cut-off); the slack covers the provider round trip. This
+# only bounds our wait: providers whose SDK call runs in a worker thread
+# (daytona, blaxel) can't be interrupted, so the command keeps running in
+# the sandbox until it finishes or the provider enforces the timeout
+EXEC_TIMEOUT_BOUND = 8.0
+
 
 class CompetitiveSuite(TestSuite):
     """Baekjoon-style competitive programming tests: stdin piping,
@@ -29,124 +37,65 @@ class CompetitiveSuite(TestSuite):
     async def _stdin_piping(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
         cmd = "echo '3 5' | python3 -c \"a,b=map(int,input().split()); print(a+b)\""
-        try:
+        async with timed_phase("stdin_piping", "stdin_piping") as phase:
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id, cmd
             )
-            success = exit_code == 0 and "8" in stdout.strip()
-            friction = 0 if success else 1
-            return PhaseResult(
-                name="stdin_piping",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=friction,
-                capability_tested="stdin_piping",
-                capability_supported=success,
-                details={"stdout": stdout, "stderr": stderr, "exit_code": exit_code},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="stdin_piping",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=1,
-                capability_tested="stdin_piping",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            phase.success = exit_code == 0 and "8" in stdout
+            phase.details = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code}
+        return phase.result()
 
     async def _gcc_compilation(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
         c_code = '#include <stdio.h>\nint main() { printf("hello-c\\n"); return 0; }'
-        try:
+        async with timed_phase("gcc_compilation", "gcc", tool_calls=2) as phase:
             await provider.write_file(sandbox_id, "/tmp/hello.c", c_code)
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id,
                 "gcc /tmp/hello.c -o /tmp/hello_c && /tmp/hello_c",
+                max_output_bytes=500,
             )
-            success = exit_code == 0 and "hello-c" in stdout
-            return PhaseResult(
-                name="gcc_compilation",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=2,
-                friction_points=0 if success else 1,
-                capability_tested="gcc",
-                capability_supported=success,
-                details={"stdout": stdout, "stderr": stderr, "exit_code": exit_code},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="gcc_compilation",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=2,
-                friction_points=1,
-                capability_tested="gcc",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            phase.success = exit_code == 0 and "hello-c" in stdout
+            phase.details = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code}
+        return phase.result()
 
     async def _cpp_compilation(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
         cpp_code = (
             '#include <iostream>\n'
             'int main() { std::cout << "hello-cpp" << std::endl; return 0; }'
         )
-        try:
+        async with timed_phase("cpp_compilation", "gpp", tool_calls=2) as phase:
             await provider.write_file(sandbox_id, "/tmp/hello.cpp", cpp_code)
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id,
                 "g++ /tmp/hello.cpp -o /tmp/hello_cpp && /tmp/hello_cpp",
+                max_output_bytes=500,
             )
-            success = exit_code == 0 and "hello-cpp" in stdout
-            return PhaseResult(
-                name="cpp_compilation",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=2,
-                friction_points=0 if success else 1,
-                capability_tested="gpp",
-                capability_supported=success,
-                details={"stdout": stdout, "stderr": stderr, "exit_code": exit_code},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="cpp_compilation",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=2,
-                friction_points=1,
-                capability_tested="gpp",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            phase.success = exit_code == 0 and "hello-cpp" in stdout
+            phase.details = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code}
+        return phase.result()
 
     async def _exec_timeout(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         # Script sleeps 10s, but we set a 3s timeout
         cmd = "python3 -c \"import time; time.sleep(10); print('done')\""
         try:
-            stdout, stderr, exit_code = await provider.execute_command(
-                sandbox_id, cmd, timeout_seconds=3
+            # Bound the wait ourselves so a provider that ignores the timeout
+            # costs at most EXEC_TIMEOUT_BOUND seconds, not the full sleep
+            stdout, stderr, exit_code = await asyncio.wait_for(
+                provider.execute_command(sandbox_id, cmd, timeout_seconds=3),
+                EXEC_TIMEOUT_BOUND,
             )
-            # If we get here quickly with a non-zero exit, timeout was enforced
-            elapsed = time.time() - t0
-            # Timeout is enforced if the command didn't run the full 10s
-            enforced = elapsed < 8 and exit_code != 0
-            # Also count as enforced if provider raised and we got an empty result
-            if not enforced and "done" not in stdout and elapsed < 8:
-                enforced = True
+            elapsed = time.perf_counter() - t0
+            # Returning inside the bound without the final print means the
+            # provider stopped the command
+            enforced = "done" not in stdout
             return PhaseResult(
                 name="exec_timeout",
                 success=enforced,
@@ -162,53 +111,46 @@ class CompetitiveSuite(TestSuite):
                     "elapsed": elapsed,
                 },
             )
+        except asyncio.TimeoutError:
+            # The provider was still waiting on the command past its timeout
+            elapsed = time.perf_counter() - t0
+            return PhaseResult(
+                name="exec_timeout",
+                success=False,
+                duration_seconds=elapsed,
+                tool_calls=1,
+                friction_points=1,
+                capability_tested="exec_timeout",
+                capability_supported=False,
+                error_messages=[f"Timeout not enforced within {EXEC_TIMEOUT_BOUND}s"],
+                details={"elapsed": elapsed},
+            )
         except Exception as e:
-            elapsed = time.time() - t0
-            # A timeout exception within a reasonable window means enforcement worked
-            enforced = elapsed < 8
+            elapsed = time.perf_counter() - t0
+            # A provider timeout exception inside the bound means enforcement worked
             return PhaseResult(
                 name="exec_timeout",
-                success=enforced,
+                success=True,
                 duration_seconds=elapsed,
                 tool_calls=1,
-                friction_points=0 if enforced else 1,
                 capability_tested="exec_timeout",
-                capability_supported=enforced,
-                error_messages=[] if enforced else [str(e)],
+                capability_supported=True,
                 details={"elapsed": elapsed, "exception": str(e)},
             )
 
     async def _python_version(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
-        try:
+        # A missing python3 is reported as a capability gap, not friction
+        async with timed_phase("python_version", "python3", failure_friction=0) as phase:
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id, "python3 --version"
             )
             # python3 --version may output to stdout or stderr
-            version_str = (stdout + stderr).strip()
-            success = exit_code == 0 and "Python" in version_str
-            return PhaseResult(
-                name="python_version",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                capability_tested="python3",
-                capability_supported=success,
-                details={"version": version_str},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="python_version",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=1,
-                capability_tested="python3",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            version_str = stdout.strip() or stderr.strip()
+            phase.success = exit_code == 0 and "Python" in version_str
+            phase.details = {"version": version_str}
+        return phase.result()
 
 
 register_suite(CompetitiveSuite)
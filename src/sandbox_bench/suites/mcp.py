@@ -16,7 +16,7 @@ from ..provider import SandboxProvider
 # ---------------------------------------------------------------------------
 
 _MCP_HARNESS_HEADER = r'''
-import subprocess, json, sys, os, signal, threading, select
+import subprocess, json, sys, os, signal, threading, select, time
 
 # Ensure uv/uvx is on PATH (may have been installed to ~/.local/bin)
 _local_bin = os.path.expanduser("~/.local/bin")
@@ -116,9 +116,9 @@ def _mcp_recv(proc, timeout=30):
 
 def _mcp_recv_response(proc, expected_id, timeout=30):
     """Read responses until we get one with the expected id (skip notifications)."""
-    deadline = __import__("time").time() + timeout
+    deadline = time.monotonic() + timeout
     while True:
-        remaining = deadline - __import__("time").time()
+        remaining = deadline - time.monotonic()
         if remaining <= 0:
             raise RuntimeError(f"Timeout waiting for response id={expected_id}")
         msg = _mcp_recv(proc, timeout=remaining)
@@ -218,7 +218,7 @@ class McpSuite(TestSuite):
     async def _npx_available(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         try:
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id, "npx --version"
@@ -227,7 +227,7 @@ class McpSuite(TestSuite):
             return PhaseResult(
                 name="npx_available",
                 success=success,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=1,
                 friction_points=0 if success else 1,
                 capability_tested="npx_mcp",
@@ -238,7 +238,7 @@ class McpSuite(TestSuite):
             return PhaseResult(
                 name="npx_available",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=1,
                 friction_points=1,
                 capability_tested="npx_mcp",
@@ -251,7 +251,7 @@ class McpSuite(TestSuite):
     async def _uvx_available(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         tool_calls = 0
         try:
             # Check if uvx is already available
@@ -286,7 +286,7 @@ class McpSuite(TestSuite):
             return PhaseResult(
                 name="uvx_available",
                 success=success,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=tool_calls,
                 friction_points=0 if success else 1,
                 capability_tested="uvx_mcp",
@@ -297,7 +297,7 @@ class McpSuite(TestSuite):
             return PhaseResult(
                 name="uvx_available",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=tool_calls,
                 friction_points=1,
                 capability_tested="uvx_mcp",
@@ -310,12 +310,12 @@ class McpSuite(TestSuite):
     async def _mcp_stdio_calculator(
         self, provider: SandboxProvider, sandbox_id: str, uvx_ok: bool
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         if not uvx_ok:
             return PhaseResult(
                 name="mcp_stdio_calculator",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 friction_points=1,
                 capability_tested="mcp_stdio",
                 capability_supported=False,
@@ -364,7 +364,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_stdio_calculator",
                 success=success,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=0 if success else 1,
                 capability_tested="mcp_stdio",
@@ -380,7 +380,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_stdio_calculator",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=1,
                 capability_tested="mcp_stdio",
@@ -393,12 +393,12 @@ except Exception as e:
     async def _mcp_filesystem(
         self, provider: SandboxProvider, sandbox_id: str, npx_ok: bool
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         if not npx_ok:
             return PhaseResult(
                 name="mcp_filesystem",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 friction_points=1,
                 capability_tested="mcp_filesystem",
                 capability_supported=False,
@@ -454,7 +454,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_filesystem",
                 success=success,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=3,  # npm install + write_file + execute
                 friction_points=0 if success else 1,
                 capability_tested="mcp_filesystem",
@@ -470,7 +470,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_filesystem",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=3,
                 friction_points=1,
                 capability_tested="mcp_filesystem",
@@ -483,12 +483,12 @@ except Exception as e:
     async def _mcp_fetch(
         self, provider: SandboxProvider, sandbox_id: str, uvx_ok: bool
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         if not uvx_ok:
             return PhaseResult(
                 name="mcp_fetch",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 friction_points=1,
                 capability_tested="mcp_network",
                 capability_supported=False,
@@ -535,7 +535,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_fetch",
                 success=success,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=0 if success else 1,
                 capability_tested="mcp_network",
@@ -551,7 +551,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_fetch",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=1,
                 capability_tested="mcp_network",
@@ -565,7 +565,7 @@ except Exception as e:
         self, provider: SandboxProvider, sandbox_id: str,
         npx_ok: bool, uvx_ok: bool
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         if not (npx_ok and uvx_ok):
             missing = []
             if not npx_ok:
@@ -575,7 +575,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_multi_server",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 friction_points=1,
                 capability_tested="mcp_multi",
                 capability_supported=False,
@@ -662,7 +662,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_multi_server",
                 success=success,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=0 if success else 1,
                 capability_tested="mcp_multi",
@@ -678,7 +678,7 @@ except Exception as e:
             return PhaseResult(
                 name="mcp_multi_server",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=1,
                 capability_tested="mcp_multi",
@@ -68,7 +68,7 @@ class NetworkingSuite(TestSuite):
         timeout: int = 30,
     ) -> PhaseResult:
         """Write a Python script, execute it, parse JSON output."""
-        t0 = time.time()
+        t0 = time.perf_counter()
         try:
             filename = f"/tmp/net_{phase_name}.py"
             await provider.write_file(sandbox_id, filename, script)
@@ -82,7 +82,7 @@ class NetworkingSuite(TestSuite):
             return PhaseResult(
                 name=phase_name,
                 success=success,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=0 if success else 1,
                 capability_tested=capability,
@@ -98,7 +98,7 @@ class NetworkingSuite(TestSuite):
             return PhaseResult(
                 name=phase_name,
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=1,
                 capability_tested=capability,
@@ -186,9 +186,9 @@ import socket, json, time
 try:
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.settimeout(10)
-    t0 = time.time()
+    t0 = time.perf_counter()
     sock.connect(("httpbin.org", 443))
-    latency_ms = (time.time() - t0) * 1000
+    latency_ms = (time.perf_counter() - t0) * 1000
     peer = sock.getpeername()
     sock.close()
     print(json.dumps({"success": True, "peer": list(peer), "latency_ms": round(latency_ms, 1)}))
@@ -215,9 +215,9 @@ import socket, json, time
 try:
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.settimeout(10)
-    t0 = time.time()
+    t0 = time.perf_counter()
     sock.connect(("portquiz.net", 8080))
-    latency_ms = (time.time() - t0) * 1000
+    latency_ms = (time.perf_counter() - t0) * 1000
     peer = sock.getpeername()
     sock.close()
     print(json.dumps({"success": True, "peer": list(peer), "latency_ms": round(latency_ms, 1)}))
@@ -256,10 +256,10 @@ try:
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.settimeout(5)
-    t0 = time.time()
+    t0 = time.perf_counter()
     sock.sendto(query, ("8.8.8.8", 53))
     data, addr = sock.recvfrom(512)
-    latency_ms = (time.time() - t0) * 1000
+    latency_ms = (time.perf_counter() - t0) * 1000
     sock.close()
 
     # Parse response: check we got an answer
@@ -292,12 +292,12 @@ except Exception as e:
         script = r'''
 import urllib.request, json, time, ssl
 try:
-    t0 = time.time()
+    t0 = time.perf_counter()
     ctx = ssl.create_default_context()
     req = urllib.request.Request("https://httpbin.org/get", headers={"User-Agent": "sandbox-bench/1.0"})
     resp = urllib.request.urlopen(req, timeout=15, context=ctx)
     body = resp.read().decode()
-    latency_ms = (time.time() - t0) * 1000
+    latency_ms = (time.perf_counter() - t0) * 1000
     data = json.loads(body)
     success = "url" in data and resp.status == 200
     print(json.dumps({
@@ -329,10 +329,10 @@ try:
         headers={"Content-Type": "application/json", "User-Agent": "sandbox-bench/1.0"},
         method="POST",
     )
-    t0 = time.time()
+    t0 = time.perf_counter()
     resp = urllib.request.urlopen(req, timeout=15)
     body = resp.read().decode()
-    latency_ms = (time.time() - t0) * 1000
+    latency_ms = (time.perf_counter() - t0) * 1000
     data = json.loads(body)
     echo_json = json.loads(data.get("data", "{}"))
     success = echo_json.get("value") == 42 and resp.status == 200
@@ -357,7 +357,7 @@ except Exception as e:
         script = r'''
 import socket, ssl, json, hashlib, base64, os, time
 try:
-    t0 = time.time()
+    t0 = time.perf_counter()
     host = "echo.websocket.events"
     port = 443
 
@@ -391,7 +391,7 @@ try:
     status_line = response.split(b"\r\n")[0].decode()
     success = "101" in status_line
 
-    latency_ms = (time.time() - t0) * 1000
+    latency_ms = (time.perf_counter() - t0) * 1000
     sock.close()
     print(json.dumps({
         "success": success,
@@ -423,9 +423,9 @@ try:
         addr_info = results[0]
         sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
         sock.settimeout(10)
-        t0 = time.time()
+        t0 = time.perf_counter()
         sock.connect(addr_info[4])
-        latency_ms = (time.time() - t0) * 1000
+        latency_ms = (time.perf_counter() - t0) * 1000
         peer = sock.getpeername()
         sock.close()
         print(json.dumps({
@@ -504,10 +504,10 @@ import socket, json, time
 try:
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.settimeout(10)
-    t0 = time.time()
+    t0 = time.perf_counter()
     sock.connect(("github.com", 22))
     banner = sock.recv(256)
-    latency_ms = (time.time() - t0) * 1000
+    latency_ms = (time.perf_counter() - t0) * 1000
     sock.close()
     banner_str = banner.decode(errors="replace").strip()
     success = banner_str.startswith("SSH-")
@@ -536,10 +536,10 @@ except Exception as e:
 import urllib.request, json, time
 try:
     url = "https://speed.hetzner.de/100KB.bin"
-    t0 = time.time()
+    t0 = time.perf_counter()
     resp = urllib.request.urlopen(url, timeout=30)
     data = resp.read()
-    elapsed = time.time() - t0
+    elapsed = time.perf_counter() - t0
     size_bytes = len(data)
     mbps = (size_bytes * 8) / (elapsed * 1_000_000) if elapsed > 0 else 0
     print(json.dumps({
@@ -578,7 +578,7 @@ def connect(idx):
         results[idx] = str(e)
 
 try:
-    t0 = time.time()
+    t0 = time.perf_counter()
     threads = []
     for i in range(NUM):
         t = threading.Thread(target=connect, args=(i,))
@@ -586,7 +586,7 @@ try:
         t.start()
     for t in threads:
         t.join(timeout=15)
-    elapsed = time.time() - t0
+    elapsed = time.perf_counter() - t0
 
     successes = sum(1 for r in results if r is True)
     failures = [str(r) for r in results if r is not True and r is not None]
@@ -6,6 +6,12 @@ from typing import List
 from . import PhaseResult, TestSuite, register_suite
 from ..provider import SandboxProvider
 
+# File I/O payloads, built once so the timed phases measure transfer rather
+# than allocating megabytes of str on every run. They stay str so every
+# provider uploads through the same write path it used at baseline
+_PAYLOAD_1MB = "x" * (1024 * 1024)
+_PAYLOAD_10MB = "y" * (10 * 1024 * 1024)
+
 
 class PerformanceSuite(TestSuite):
     """Performance benchmarks: warm start, large file I/O, rapid exec."""
@@ -13,6 +19,9 @@ class PerformanceSuite(TestSuite):
     name = "performance"
     description = "Warm start time, file I/O throughput, rapid execution latency"
 
+    # Commands run back to back by rapid_exec
+    RAPID_EXEC_ITERATIONS = 10
+
     async def run(
         self,
         provider: SandboxProvider,
@@ -34,19 +43,19 @@ class PerformanceSuite(TestSuite):
         and execute a trivial command to confirm it is ready.  This measures
         the end-to-end latency an orchestrator experiences when delegating
         work to a sub-agent that needs its own sandbox."""
-        t0 = time.time()
+        t0 = time.perf_counter()
         spawn_id = None
         try:
             spawn_id = await provider.create_sandbox(timeout_seconds=60)
-            create_time = time.time() - t0
+            create_time = time.perf_counter() - t0
 
             # Verify sandbox is truly ready by executing a command
-            t_exec = time.time()
+            t_exec = time.perf_counter()
             stdout, stderr, exit_code = await provider.execute_command(
                 spawn_id, "echo ready"
             )
-            exec_time = time.time() - t_exec
-            total = time.time() - t0
+            exec_time = time.perf_counter() - t_exec
+            total = time.perf_counter() - t0
 
             ready = exit_code == 0 and "ready" in stdout
             return PhaseResult(
@@ -67,7 +76,7 @@ class PerformanceSuite(TestSuite):
             return PhaseResult(
                 name="agent_spawn",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=1,
                 friction_points=1,
                 capability_tested="agent_spawn",
@@ -85,11 +94,11 @@ class PerformanceSuite(TestSuite):
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
         """Create a 2nd sandbox immediately, time it, destroy it."""
-        t0 = time.time()
+        t0 = time.perf_counter()
         warm_id = None
         try:
             warm_id = await provider.create_sandbox(timeout_seconds=60)
-            create_time = time.time() - t0
+            create_time = time.perf_counter() - t0
             return PhaseResult(
                 name="warm_start",
                 success=True,
@@ -103,7 +112,7 @@ class PerformanceSuite(TestSuite):
             return PhaseResult(
                 name="warm_start",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=1,
                 friction_points=1,
                 capability_tested="warm_start",
@@ -120,12 +129,10 @@ class PerformanceSuite(TestSuite):
     async def _file_io_1mb_write(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
-        # 1MB of data
-        data = "x" * (1024 * 1024)
+        t0 = time.perf_counter()
         try:
-            await provider.write_file(sandbox_id, "/tmp/bench-1mb.txt", data)
-            elapsed = time.time() - t0
+            await provider.write_file(sandbox_id, "/tmp/bench-1mb.txt", _PAYLOAD_1MB)
+            elapsed = time.perf_counter() - t0
             throughput_mbps = 1.0 / elapsed if elapsed > 0 else 0
             return PhaseResult(
                 name="file_io_1mb_write",
@@ -138,7 +145,7 @@ class PerformanceSuite(TestSuite):
             return PhaseResult(
                 name="file_io_1mb_write",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=1,
                 friction_points=1,
                 error_messages=[str(e)],
@@ -147,10 +154,10 @@ class PerformanceSuite(TestSuite):
     async def _file_io_1mb_read(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
+        t0 = time.perf_counter()
         try:
             content = await provider.read_file(sandbox_id, "/tmp/bench-1mb.txt")
-            elapsed = time.time() - t0
+            elapsed = time.perf_counter() - t0
             size_mb = len(content) / (1024 * 1024) if content else 0
             throughput_mbps = size_mb / elapsed if elapsed > 0 else 0
             return PhaseResult(
@@ -167,7 +174,7 @@ class PerformanceSuite(TestSuite):
             return PhaseResult(
                 name="file_io_1mb_read",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=1,
                 friction_points=1,
                 error_messages=[str(e)],
@@ -176,18 +183,17 @@ class PerformanceSuite(TestSuite):
     async def _file_io_10mb(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
-        data = "y" * (10 * 1024 * 1024)
+        t0 = time.perf_counter()
         try:
-            t_write = time.time()
-            await provider.write_file(sandbox_id, "/tmp/bench-10mb.txt", data)
-            write_elapsed = time.time() - t_write
+            t_write = time.perf_counter()
+            await provider.write_file(sandbox_id, "/tmp/bench-10mb.txt", _PAYLOAD_10MB)
+            write_elapsed = time.perf_counter() - t_write
 
-            t_read = time.time()
+            t_read = time.perf_counter()
             content = await provider.read_file(sandbox_id, "/tmp/bench-10mb.txt")
-            read_elapsed = time.time() - t_read
+            read_elapsed = time.perf_counter() - t_read
 
-            total = time.time() - t0
+            total = time.perf_counter() - t0
             write_mbps = 10.0 / write_elapsed if write_elapsed > 0 else 0
             read_mbps = (len(content) / (1024 * 1024)) / read_elapsed if read_elapsed > 0 else 0
 
@@ -207,7 +213,7 @@ class PerformanceSuite(TestSuite):
             return PhaseResult(
                 name="file_io_10mb",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=2,
                 friction_points=1,
                 error_messages=[str(e)],
@@ -216,17 +222,19 @@ class PerformanceSuite(TestSuite):
     async def _rapid_exec(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        """Run echo ok 10x in succession, measure average latency."""
-        t0 = time.time()
+        """Run echo ok RAPID_EXEC_ITERATIONS times in succession, measure
+        average latency."""
+        iterations = self.RAPID_EXEC_ITERATIONS
+        t0 = time.perf_counter()
         latencies = []
         failures = 0
         try:
-            for _ in range(10):
-                t_exec = time.time()
+            for _ in range(iterations):
+                t_exec = time.perf_counter()
                 stdout, stderr, exit_code = await provider.execute_command(
                     sandbox_id, "echo ok"
                 )
-                latencies.append(time.time() - t_exec)
+                latencies.append(time.perf_counter() - t_exec)
                 if exit_code != 0 or "ok" not in stdout:
                     failures += 1
 
@@ -234,14 +242,14 @@ class PerformanceSuite(TestSuite):
             return PhaseResult(
                 name="rapid_exec",
                 success=failures == 0,
-                duration_seconds=time.time() - t0,
-                tool_calls=10,
+                duration_seconds=time.perf_counter() - t0,
+                tool_calls=iterations,
                 friction_points=min(failures, 3),
                 details={
                     "avg_latency_ms": round(avg_latency * 1000, 1),
                     "min_latency_ms": round(min(latencies) * 1000, 1) if latencies else 0,
                     "max_latency_ms": round(max(latencies) * 1000, 1) if latencies else 0,
-                    "iterations": 10,
+                    "iterations": iterations,
                     "failures": failures,
                 },
             )
@@ -249,7 +257,7 @@ class PerformanceSuite(TestSuite):
             return PhaseResult(
                 name="rapid_exec",
                 success=False,
-                duration_seconds=time.time() - t0,
+                duration_seconds=time.perf_counter() - t0,
                 tool_calls=len(latencies) + 1,
                 friction_points=1,
                 error_messages=[str(e)],
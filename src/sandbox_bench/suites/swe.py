@@ -1,9 +1,8 @@
 """SWE-bench-style software engineering test suite."""
 
-import time
 from typing import List
 
-from . import PhaseResult, TestSuite, register_suite
+from . import PhaseResult, TestSuite, register_suite, timed_phase
 from ..provider import SandboxProvider
 
 
@@ -28,114 +27,53 @@ class SweSuite(TestSuite):
     async def _network_access(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
         cmd = (
             "python3 -c \""
             "import urllib.request; "
             "print(urllib.request.urlopen('https://httpbin.org/get').status)"
             "\""
         )
-        try:
+        async with timed_phase("network_access", "network_access") as phase:
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id, cmd, timeout_seconds=15
             )
-            success = exit_code == 0 and "200" in stdout.strip()
-            return PhaseResult(
-                name="network_access",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=0 if success else 1,
-                capability_tested="network_access",
-                capability_supported=success,
-                details={"stdout": stdout, "stderr": stderr, "exit_code": exit_code},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="network_access",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=1,
-                capability_tested="network_access",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            phase.success = exit_code == 0 and "200" in stdout
+            phase.details = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code}
+        return phase.result()
 
     async def _pip_install(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
         cmd = (
             "pip install requests==2.31.0 -q && "
             "python3 -c \"import requests; print(requests.__version__)\""
         )
-        try:
+        async with timed_phase("pip_install", "pip_install") as phase:
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id, cmd, timeout_seconds=60
             )
-            success = exit_code == 0 and "2.31.0" in stdout
-            return PhaseResult(
-                name="pip_install",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=0 if success else 1,
-                capability_tested="pip_install",
-                capability_supported=success,
-                details={"stdout": stdout, "stderr": stderr, "exit_code": exit_code},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="pip_install",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=1,
-                capability_tested="pip_install",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            phase.success = exit_code == 0 and "2.31.0" in stdout
+            phase.details = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code}
+        return phase.result()
 
     async def _git_clone(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
         cmd = (
             "git clone --depth 1 https://github.com/pallets/flask.git "
             "/tmp/flask-test 2>&1 && test -d /tmp/flask-test/.git"
         )
-        try:
+        async with timed_phase("git_clone", "git_clone") as phase:
             stdout, stderr, exit_code = await provider.execute_command(
                 sandbox_id, cmd, timeout_seconds=30
             )
-            success = exit_code == 0
-            return PhaseResult(
-                name="git_clone",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=0 if success else 1,
-                capability_tested="git_clone",
-                capability_supported=success,
-                details={"stdout": stdout, "stderr": stderr, "exit_code": exit_code},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="git_clone",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=1,
-                friction_points=1,
-                capability_tested="git_clone",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            phase.success = exit_code == 0
+            phase.details = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code}
+        return phase.result()
 
     async def _pytest_run(
         self, provider: SandboxProvider, sandbox_id: str
     ) -> PhaseResult:
-        t0 = time.time()
         test_code = (
             "def test_add():\n"
             "    assert 1 + 1 == 2\n"
@@ -143,7 +81,7 @@ class SweSuite(TestSuite):
             "def test_string():\n"
             "    assert 'hello'.upper() == 'HELLO'\n"
         )
-        try:
+        async with timed_phase("pytest_run", "pytest", tool_calls=2) as phase:
             await provider.write_file(
                 sandbox_id, "/tmp/test_bench.py", test_code
             )
@@ -152,28 +90,9 @@ class SweSuite(TestSuite):
                 "pip install pytest -q 2>/dev/null; python3 -m pytest /tmp/test_bench.py -v 2>&1",
                 timeout_seconds=60,
             )
-            success = exit_code == 0 and "passed" in stdout
-            return PhaseResult(
-                name="pytest_run",
-                success=success,
-                duration_seconds=time.time() - t0,
-                tool_calls=2,
-                friction_points=0 if success else 1,
-                capability_tested="pytest",
-                capability_supported=success,
-                details={"stdout": stdout, "stderr": stderr, "exit_code": exit_code},
-            )
-        except Exception as e:
-            return PhaseResult(
-                name="pytest_run",
-                success=False,
-                duration_seconds=time.time() - t0,
-                tool_calls=2,
-                friction_points=1,
-                capability_tested="pytest",
-                capability_supported=False,
-                error_messages=[str(e)],
-            )
+            phase.success = exit_code == 0 and "passed" in stdout
+            phase.details = {"stdout": stdout, "stderr": stderr, "exit_code": exit_code}
+        return phase.result()
 
 
 register_suite(SweSuite)
@@ -0,0 +1,202 @@
+"""Throughput test suite.
+
+Concurrent file I/O, in-sandbox disk speed and concurrent exec latency.
+These phases are reported alongside the scored suites but kept out of the
+score (see ``TestSuite.scored``), so adding them doesn't shift results
+recorded before they existed.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import List
+
+from . import PhaseResult, TestSuite, batch_file_ops, register_suite
+from ..provider import SandboxProvider
+
+# Compared with what read_file() returns, so it stays str
+_PAYLOAD_256KB = "z" * (256 * 1024)
+
+# Times a 10MB fsync'd write and a read-back inside the sandbox, so the
+# figures reflect its disk rather than the provider's upload path. The page
+# cache is dropped for the file (where supported) before reading it back.
+_DISK_IO_SCRIPT = """
+import os, time
+path, block = "/tmp/bench-disk-10mb.bin", b"d" * (1024 * 1024)
+t0 = time.perf_counter()
+fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+for _ in range(10):
+    os.write(fd, block)
+os.fsync(fd)
+os.close(fd)
+write_s = time.perf_counter() - t0
+fd = os.open(path, os.O_RDONLY)
+if hasattr(os, "posix_fadvise"):
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+t0 = time.perf_counter()
+size = 0
+while chunk := os.read(fd, 1024 * 1024):
+    size += len(chunk)
+read_s = time.perf_counter() - t0
+os.close(fd)
+os.unlink(path)
+print(write_s, read_s, size)
+"""
+
+
+class ThroughputSuite(TestSuite):
+    """Throughput benchmarks: concurrent file I/O, disk speed, concurrent exec."""
+
+    name = "throughput"
+    description = "Concurrent file I/O, in-sandbox disk speed, concurrent exec latency (unscored)"
+    scored = False
+
+    # Commands run at once by rapid_exec_parallel
+    RAPID_EXEC_ITERATIONS = 10
+
+    async def run(
+        self,
+        provider: SandboxProvider,
+        sandbox_id: str,
+    ) -> List[PhaseResult]:
+        results = []
+        results.append(await self._file_io_1mb_parallel(provider, sandbox_id))
+        results.append(await self._file_io_disk(provider, sandbox_id))
+        results.append(await self._rapid_exec_parallel(provider, sandbox_id))
+        return results
+
+    async def _file_io_1mb_parallel(
+        self, provider: SandboxProvider, sandbox_id: str
+    ) -> PhaseResult:
+        """Write 1MB as a batch of 4 256KB chunks, then read them back as
+        one batch.  Compare against file_io_1mb_write/read to see how well
+        the provider overlaps or batches independent file operations."""
+        t0 = time.perf_counter()
+        chunk = _PAYLOAD_256KB
+        paths = [f"/tmp/bench-1mb-part{i}.txt" for i in range(4)]
+        try:
+            t_write = time.perf_counter()
+            await batch_file_ops(
+                provider, sandbox_id, writes={p: chunk for p in paths}
+            )
+            write_elapsed = time.perf_counter() - t_write
+
+            t_read = time.perf_counter()
+            contents = await batch_file_ops(provider, sandbox_id, reads=paths)
+            read_elapsed = time.perf_counter() - t_read
+
+            success = all(c == chunk for c in contents)
+            return PhaseResult(
+                name="file_io_1mb_parallel",
+                success=success,
+                duration_seconds=time.perf_counter() - t0,
+                tool_calls=len(paths) * 2,
+                friction_points=0 if success else 1,
+                details={
+                    "chunks": len(paths),
+                    "write_mbps": round(1.0 / write_elapsed, 2) if write_elapsed > 0 else 0,
+                    "read_mbps": round(1.0 / read_elapsed, 2) if read_elapsed > 0 else 0,
+                },
+            )
+        except Exception as e:
+            return PhaseResult(
+                name="file_io_1mb_parallel",
+                success=False,
+                duration_seconds=time.perf_counter() - t0,
+                tool_calls=len(paths) * 2,
+                friction_points=1,
+                error_messages=[str(e)],
+            )
+
+    async def _file_io_disk(
+        self, provider: SandboxProvider, sandbox_id: str
+    ) -> PhaseResult:
+        """Write and read back 10MB from inside the sandbox.  Compare against
+        file_io_10mb to separate the sandbox's disk speed from the cost of
+        moving data through the provider's file API."""
+        t0 = time.perf_counter()
+        try:
+            stdout, stderr, exit_code = await provider.execute(
+                sandbox_id, _DISK_IO_SCRIPT, language="python"
+            )
+            if exit_code != 0:
+                raise RuntimeError(stderr.strip() or f"exit code {exit_code}")
+            fields = stdout.split()
+            if len(fields) != 3:
+                raise RuntimeError(f"Unexpected output: {stdout!r}")
+            write_s, read_s = float(fields[0]), float(fields[1])
+            size_mb = int(fields[2]) / (1024 * 1024)
+            return PhaseResult(
+                name="file_io_disk",
+                success=True,
+                duration_seconds=time.perf_counter() - t0,
+                tool_calls=1,
+                details={
+                    "disk_write_mbps": round(10.0 / write_s, 2) if write_s > 0 else 0,
+                    "disk_read_mbps": round(size_mb / read_s, 2) if read_s > 0 else 0,
+                    "write_seconds": round(write_s, 3),
+                    "read_seconds": round(read_s, 3),
+                },
+            )
+        except Exception as e:
+            return PhaseResult(
+                name="file_io_disk",
+                success=False,
+                duration_seconds=time.perf_counter() - t0,
+                tool_calls=1,
+                friction_points=1,
+                error_messages=[str(e)],
+            )
+
+    async def _rapid_exec_parallel(
+        self, provider: SandboxProvider, sandbox_id: str
+    ) -> PhaseResult:
+        """Run echo ok RAPID_EXEC_ITERATIONS times concurrently.  Compare
+        against rapid_exec to see whether the provider multiplexes execs on
+        one sandbox or queues them."""
+        iterations = self.RAPID_EXEC_ITERATIONS
+
+        async def _timed_echo() -> tuple[float, bool]:
+            t_exec = time.perf_counter()
+            stdout, stderr, exit_code = await provider.execute_command(
+                sandbox_id, "echo ok"
+            )
+            return time.perf_counter() - t_exec, exit_code == 0 and "ok" in stdout
+
+        t0 = time.perf_counter()
+        try:
+            outcomes = await asyncio.gather(
+                *[_timed_echo() for _ in range(iterations)]
+            )
+            elapsed = time.perf_counter() - t0
+            latencies = [latency for latency, _ in outcomes]
+            failures = sum(1 for _, ok in outcomes if not ok)
+            # 19 cut points: index 9 is the median, index 18 the 95th percentile
+            cuts = statistics.quantiles(latencies, n=20)
+            return PhaseResult(
+                name="rapid_exec_parallel",
+                success=failures == 0,
+                duration_seconds=elapsed,
+                tool_calls=iterations,
+                friction_points=min(failures, 3),
+                details={
+                    "p50_latency_ms": round(cuts[9] * 1000, 1),
+                    "p95_latency_ms": round(cuts[18] * 1000, 1),
+                    "max_latency_ms": round(max(latencies) * 1000, 1),
+                    "execs_per_second": round(iterations / elapsed, 1) if elapsed > 0 else 0,
+                    "iterations": iterations,
+                    "failures": failures,
+                },
+            )
+        except Exception as e:
+            return PhaseResult(
+                name="rapid_exec_parallel",
+                success=False,
+                duration_seconds=time.perf_counter() - t0,
+                tool_calls=iterations,
+                friction_points=1,
+                error_messages=[str(e)],
+            )
+
+
+register_suite(ThroughputSuite)
@@ -172,7 +172,7 @@ class TrainingBatchSuite(TestSuite):
         failure_samples: List[str] = []
         failed_count = 0
 
-        t_tier = time.time()
+        t_tier = time.perf_counter()
 
         # --- Create phase (worker pool) ---
         # Shared mutable counter — safe because asyncio is single-threaded;
@@ -187,7 +187,7 @@ class TrainingBatchSuite(TestSuite):
                 done = len(created_ids) + failed_count
                 if done != _last_log_count[0]:
                     _last_log_count[0] = done
-                    elapsed = time.time() - t_create
+                    elapsed = time.perf_counter() - t_create
                     _log(
                         f"  CREATE: {len(created_ids)} ok + {failed_count} fail "
                         f"= {done}/{batch_size} ({elapsed:.0f}s elapsed)"
@@ -231,7 +231,7 @@ class TrainingBatchSuite(TestSuite):
 
         num_create_workers = min(WORKER_POOL_SIZE, batch_size)
         _log(f"  CREATE phase: {batch_size} sandboxes, {num_create_workers} workers")
-        t_create = time.time()
+        t_create = time.perf_counter()
         progress_task = asyncio.create_task(_progress_logger())
         try:
             await asyncio.wait_for(
@@ -255,7 +255,7 @@ class TrainingBatchSuite(TestSuite):
                 await progress_task
             except asyncio.CancelledError:
                 pass
-        create_duration = time.time() - t_create
+        create_duration = time.perf_counter() - t_create
         retried = _retried_count[0]
         _log(
             f"  CREATE done: {len(created_ids)} ok, {failed_count} fail "
@@ -279,7 +279,7 @@ class TrainingBatchSuite(TestSuite):
                 done = ready_count + (verify_idx - ready_count)
                 if done != _verify_last_log[0]:
                     _verify_last_log[0] = done
-                    elapsed = time.time() - t_verify
+                    elapsed = time.perf_counter() - t_verify
                     _log(
                         f"  VERIFY: {ready_count}/{verify_idx} ready "
                         f"of {len(created_ids)} ({elapsed:.0f}s elapsed)"
@@ -303,7 +303,7 @@ class TrainingBatchSuite(TestSuite):
 
         num_verify_workers = min(WORKER_POOL_SIZE, len(created_ids))
         _log(f"  VERIFY phase: {len(created_ids)} sandboxes, {num_verify_workers} workers")
-        t_verify = time.time()
+        t_verify = time.perf_counter()
         if created_ids:
             verify_progress = asyncio.create_task(_verify_progress_logger())
             try:
@@ -322,17 +322,17 @@ class TrainingBatchSuite(TestSuite):
                     await verify_progress
                 except asyncio.CancelledError:
                     pass
-        verify_duration = time.time() - t_verify
+        verify_duration = time.perf_counter() - t_verify
         _log(f"  VERIFY done: {ready_count}/{len(created_ids)} ready in {verify_duration:.1f}s")
 
         # --- Destroy phase (worker pool) ---
         _log(f"  DESTROY phase: {len(created_ids)} sandboxes")
-        t_destroy = time.time()
+        t_destroy = time.perf_counter()
         await self._cleanup_pool(provider, created_ids)
-        destroy_duration = time.time() - t_destroy
+        destroy_duration = time.perf_counter() - t_destroy
         _log(f"  DESTROY done: {len(created_ids)} in {destroy_duration:.1f}s")
 
-        total_duration = time.time() - t_tier
+        total_duration = time.perf_counter() - t_tier
 
         # Compute metrics
         created = len(created_ids)